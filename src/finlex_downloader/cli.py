@@ -2,16 +2,22 @@
 
 import argparse
 import sys
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .client import FinlexClient
-from .downloader import download_document, DownloadOptions, DownloadResult
-from .listing import list_documents, ListConfig, get_year_range, DOCUMENT_TYPES
 from .logging_config import setup_logging, logger
 from .state import StateManager, ManifestManager, ManifestEntry
 
+if TYPE_CHECKING:
+    from .client import TokenBucket
+    from .downloader import DownloadOptions, DownloadResult
+
+# Heavy dependencies (requests, lxml, aiohttp) are imported inside
+# run_download so that --help and argument errors don't pay for them
+
 
 def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
@@ -92,6 +98,23 @@ def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
         default=5.0,
         help="Seconds between requests (default: 5)",
     )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="Requests allowed per interval (overrides --sleep)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=60.0,
+        help="Rate limit interval in seconds (default: 60)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of concurrent document downloads (default: 1, serial)",
+    )
     parser.add_argument(
         "--pdf",
         action="store_true",
@@ -142,13 +165,95 @@ def parse_args(args: Optional[list[str]] = None) -> argparse.Namespace:
 
 def get_years_for_type(args: argparse.Namespace, category: str) -> int:
     """Get years setting for a specific category."""
-    override_map = {
-        "act": args.years_act,
-        "judgment": args.years_judgment,
-        "doc": args.years_doc,
-        "authority-regulation": args.years_authority_regulation,
-    }
-    return override_map.get(category) or args.years
+    return getattr(args, "years_" + category.replace("-", "_"), None) or args.years
+
+
+def download_batch(
+    uris: list[str],
+    args: argparse.Namespace,
+    options: "DownloadOptions",
+    priors: Optional[dict[str, ManifestEntry]] = None,
+    bucket: Optional["TokenBucket"] = None,
+) -> list["DownloadResult"]:
+    """Download a batch of documents concurrently.
+
+    Drives N concurrent downloads through a semaphore-bounded coroutine
+    pool, sharing one rate limiter across all in-flight requests.
+
+    Args:
+        uris: Document URIs to download.
+        args: Parsed CLI arguments.
+        options: Download options.
+        priors: Latest manifest entry per URI, used for conditional-GET
+            revalidation.
+        bucket: Shared TokenBucket; without it each doc-type worker
+            would throttle independently and multiply the request rate.
+
+    Returns:
+        DownloadResult for each URI, in input order.
+    """
+    import asyncio
+
+    from .client_async import AsyncFinlexClient
+    from .downloader_async import download_document_async
+
+    priors = priors or {}
+
+    async def _run() -> list["DownloadResult"]:
+        semaphore = asyncio.Semaphore(args.concurrency)
+        client = AsyncFinlexClient(
+            concurrency=args.concurrency,
+            sleep_seconds=args.sleep,
+            rate=args.rate,
+            interval=args.interval,
+            bucket=bucket,
+        )
+
+        async def bounded(uri: str) -> "DownloadResult":
+            async with semaphore:
+                return await download_document_async(
+                    client, uri, options, prior=priors.get(uri)
+                )
+
+        async with client:
+            return await asyncio.gather(*[bounded(uri) for uri in uris])
+
+    return asyncio.run(_run())
+
+
+# Batching thresholds for manifest/state writes: one disk flush per
+# FLUSH_EVERY_N documents (or FLUSH_INTERVAL_SECONDS) instead of per document
+FLUSH_EVERY_N = 50
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Cap on doc-type worker threads; more would just contend on the rate limiter
+MAX_DOC_TYPE_WORKERS = 5
+
+
+def record_result(
+    result: "DownloadResult",
+    state_manager: StateManager,
+    pending_entries: list[ManifestEntry],
+) -> None:
+    """Record a download result in memory, deferring the disk write.
+
+    Args:
+        result: Result of a single download.
+        state_manager: State manager for completion tracking.
+        pending_entries: Buffer of manifest entries awaiting a flush.
+    """
+    pending_entries.append(ManifestEntry(
+        akn_uri=result.akn_uri,
+        status=result.status,
+        timestamp=result.timestamp,
+        files=result.files,
+        error=result.error,
+        etag=result.etag,
+        last_modified=result.last_modified,
+    ))
+
+    if result.status in ("success", "skipped", "not-modified"):
+        state_manager.mark_completed(result.akn_uri)
 
 
 def run_download(args: argparse.Namespace) -> int:
@@ -157,6 +262,10 @@ def run_download(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success).
     """
+    from .client import FinlexClient
+    from .downloader import download_document, DownloadOptions
+    from .listing import list_documents, ListConfig, get_year_range, CATEGORY_MAP
+
     # Setup logging
     setup_logging("DEBUG" if args.verbose else "INFO")
 
@@ -177,7 +286,7 @@ def run_download(args: argparse.Namespace) -> int:
         state_manager.load()
 
     # Initialize client
-    client = FinlexClient(sleep_seconds=args.sleep)
+    client = FinlexClient(sleep_seconds=args.sleep, rate=args.rate, interval=args.interval)
 
     # Download options
     download_opts = DownloadOptions(
@@ -193,76 +302,130 @@ def run_download(args: argparse.Namespace) -> int:
     logger.info(f"Document types: {args.types}")
     logger.info(f"Language: {args.lang}")
 
+    pending_entries: list[ManifestEntry] = []
+    last_flush = time.monotonic()
+    record_lock = threading.Lock()
+
+    def flush_pending() -> None:
+        """Flush buffered manifest entries and state to disk."""
+        nonlocal last_flush
+        if pending_entries:
+            manifest_manager.extend(pending_entries)
+            manifest_manager.flush()
+            pending_entries.clear()
+        state_manager.flush()
+        last_flush = time.monotonic()
+
+    def process_doc_type(
+        actual_category: str,
+        doc_type: str,
+        start_year: int,
+        end_year: int,
+    ) -> None:
+        """List and download every document of one type."""
+        logger.info(f"  Document type: {doc_type}")
+
+        # Check resume point
+        resume_page = 1
+        if args.resume:
+            resume_page = state_manager.get_resume_page(actual_category, doc_type)
+            if resume_page > 1:
+                logger.info(f"  Resuming from page {resume_page}")
+
+        # Configure listing
+        list_config = ListConfig(
+            category=actual_category,
+            document_type=doc_type,
+            lang_and_version=args.lang,
+            start_year=start_year,
+            end_year=end_year,
+            limit=min(args.limit, 10),
+            max_pages=args.max_pages,
+        )
+
+        # start_session saves immediately; serialize it behind the same
+        # lock as the debounced saves so concurrent workers can't race
+        # os.replace on the shared state.json.tmp path
+        with record_lock:
+            state_manager.start_session(actual_category, doc_type)
+
+        # Process documents
+        page = 0
+        pending_uris: list[str] = []
+        for item in list_documents(client, list_config):
+            page += 1
+
+            # Skip if already completed
+            if state_manager.is_completed(item.akn_uri):
+                logger.debug(f"Already completed: {item.akn_uri}")
+                continue
+
+            if args.concurrency > 1:
+                # Collect for concurrent download after listing
+                pending_uris.append(item.akn_uri)
+                continue
+
+            # Download document, revalidating against the prior manifest entry
+            result = download_document(
+                client,
+                item.akn_uri,
+                download_opts,
+                prior=manifest_manager.latest_for(item.akn_uri),
+            )
+            with record_lock:
+                record_result(result, state_manager, pending_entries)
+                state_manager.set_page(actual_category, doc_type, page)
+
+                if (len(pending_entries) >= FLUSH_EVERY_N
+                        or time.monotonic() - last_flush > FLUSH_INTERVAL_SECONDS):
+                    flush_pending()
+
+        if pending_uris:
+            logger.info(f"  Downloading {len(pending_uris)} documents with concurrency {args.concurrency}")
+            priors = {uri: manifest_manager.latest_for(uri) for uri in pending_uris}
+            for result in download_batch(
+                pending_uris, args, download_opts,
+                priors=priors, bucket=client.limiter,
+            ):
+                with record_lock:
+                    record_result(result, state_manager, pending_entries)
+            with record_lock:
+                state_manager.set_page(actual_category, doc_type, page)
+                flush_pending()
+
     try:
+        # Resolve the category/doc-type matrix up front so independent
+        # doc types can run as parallel tasks
+        tasks: list[tuple[str, str, int, int]] = []
         for category in args.types:
-            # Handle authority-regulation specially
-            if category == "authority-regulation":
-                doc_types = ["authority-regulation"]
-                actual_category = "doc"
-            else:
-                doc_types = DOCUMENT_TYPES.get(category, [])
-                actual_category = category
+            actual_category, doc_types = CATEGORY_MAP[category]
 
             years = get_years_for_type(args, category)
             start_year, end_year = get_year_range(years)
             logger.info(f"Processing {category}: years {start_year}-{end_year}")
 
             for doc_type in doc_types:
-                logger.info(f"  Document type: {doc_type}")
-
-                # Check resume point
-                resume_page = 1
-                if args.resume:
-                    resume_page = state_manager.get_resume_page(actual_category, doc_type)
-                    if resume_page > 1:
-                        logger.info(f"  Resuming from page {resume_page}")
-
-                # Configure listing
-                list_config = ListConfig(
-                    category=actual_category,
-                    document_type=doc_type,
-                    lang_and_version=args.lang,
-                    start_year=start_year,
-                    end_year=end_year,
-                    limit=min(args.limit, 10),
-                    max_pages=args.max_pages,
-                )
-
-                state_manager.start_session(actual_category, doc_type)
-
-                # Process documents
-                page = 0
-                for item in list_documents(client, list_config):
-                    page += 1
-                    
-                    # Skip if already completed
-                    if state_manager.is_completed(item.akn_uri):
-                        logger.debug(f"Already completed: {item.akn_uri}")
-                        continue
-
-                    # Download document
-                    result = download_document(client, item.akn_uri, download_opts)
-
-                    # Record in manifest
-                    manifest_entry = ManifestEntry(
-                        akn_uri=result.akn_uri,
-                        status=result.status,
-                        timestamp=result.timestamp,
-                        files=result.files,
-                        error=result.error,
-                    )
-                    manifest_manager.add(manifest_entry)
-
-                    # Update state
-                    if result.status in ("success", "skipped"):
-                        state_manager.mark_completed(item.akn_uri)
-
-                    state_manager.set_page(page)
+                tasks.append((actual_category, doc_type, start_year, end_year))
+
+        workers = min(args.concurrency, len(tasks), MAX_DOC_TYPE_WORKERS)
+        if workers > 1:
+            # Doc types hit independent list endpoints; the shared client's
+            # token bucket keeps the combined request rate within quota
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(process_doc_type, *task) for task in tasks]
+                for future in futures:
+                    future.result()
+        else:
+            for task in tasks:
+                process_doc_type(*task)
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
         return 130
     finally:
+        flush_pending()
+        state_manager.close()
+        manifest_manager.close()
         client.close()
 
     # Summary
@@ -1,14 +1,62 @@
 """HTTP client for Finlex Open Data API with retry logic."""
 
+import random
+import threading
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .logging_config import logger
 
+# Keep-alive connection pool size; the default of 10 evicts connections
+# under concurrent use, forcing fresh TLS handshakes
+POOL_SIZE = 20
+
+# Status codes worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token-bucket rate limiter.
+
+    Allows bursts up to ``rate`` requests, refilling continuously at
+    ``rate / interval`` tokens per second. Unlike a fixed sleep between
+    requests, fast responses do not pay the full interval.
+    """
+
+    def __init__(self, rate: float, interval: float):
+        """Initialize the bucket.
+
+        Args:
+            rate: Number of requests allowed per interval.
+            interval: Refill interval in seconds.
+        """
+        self.capacity = rate
+        self.fill_rate = rate / interval
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.fill_rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.fill_rate
+            logger.debug(f"Rate limit: waiting {wait:.2f}s for next token")
+            time.sleep(wait)
+
 
 class FinlexClient:
     """HTTP client for Finlex Open Data API.
@@ -16,7 +64,7 @@ class FinlexClient:
     Features:
     - Automatic User-Agent header
     - Retry with exponential backoff for 429, 5xx, timeouts
-    - Configurable sleep between requests
+    - Token-bucket rate limiting between requests
     """
 
     BASE_URL = "https://opendata.finlex.fi/finlex/avoindata/v1"
@@ -28,31 +76,44 @@ class FinlexClient:
         max_retries: int = 5,
         backoff_factor: float = 1.0,
         timeout: float = 30.0,
+        rate: Optional[float] = None,
+        interval: float = 60.0,
     ):
         """Initialize the client.
-        
+
         Args:
-            sleep_seconds: Seconds to wait between requests.
+            sleep_seconds: Legacy pacing; translated to a 1-per-sleep_seconds
+                rate when no explicit rate is given.
             max_retries: Maximum retry attempts for failed requests.
             backoff_factor: Multiplier for exponential backoff.
             timeout: Request timeout in seconds.
+            rate: Requests allowed per interval (overrides sleep_seconds).
+            interval: Rate limit interval in seconds.
         """
         self.sleep_seconds = sleep_seconds
         self.timeout = timeout
-        self._last_request_time: Optional[float] = None
-
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"],
-            raise_on_status=False,
-        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # Backward compat: a sleep of N seconds becomes 1 request per N
+        # seconds. Public so the async batch path can draw from the same
+        # bucket instead of multiplying the quota per worker.
+        if rate is not None:
+            self.limiter: Optional[TokenBucket] = TokenBucket(rate, interval)
+        elif sleep_seconds > 0:
+            self.limiter = TokenBucket(1.0, sleep_seconds)
+        else:
+            self.limiter = None
 
-        # Create session with retry adapter
+        # Create session; the enlarged pool keeps connections alive
+        # across concurrent callers so repeat requests reuse the TLS
+        # session instead of handshaking again. Retries are handled in
+        # _request_with_retry, not by adapter middleware.
         self.session = requests.Session()
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+        )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -64,50 +125,102 @@ class FinlexClient:
 
     def _wait_if_needed(self) -> None:
         """Wait to respect rate limits."""
-        if self._last_request_time is not None:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.sleep_seconds:
-                sleep_time = self.sleep_seconds - elapsed
-                logger.debug(f"Sleeping {sleep_time:.2f}s before next request")
-                time.sleep(sleep_time)
+        if self.limiter is not None:
+            self.limiter.acquire()
+
+    def _request_with_retry(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """GET with retries for transient failures.
+
+        Each attempt re-acquires the rate limiter, so retries cannot
+        bypass it the way adapter-level retry middleware did. Retry-After
+        is honored when present; otherwise backoff is exponential with a
+        little jitter.
+
+        Args:
+            url: Full URL to fetch.
+            params: Query parameters.
+            headers: Request headers.
+            stream: Whether to stream the response body.
+
+        Returns:
+            Response object (possibly still an error status after the
+            final attempt).
+
+        Raises:
+            requests.RequestException: On network errors after retries.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_if_needed()
+
+            try:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_factor * (2 ** attempt) + random.uniform(0, 0.25)
+                logger.warning(f"Request failed: {e}; retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                return response
+
+            try:
+                delay = float(response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = self.backoff_factor * (2 ** attempt)
+            delay += random.uniform(0, 0.25)
+            response.close()
+            logger.warning(f"HTTP {response.status_code} for {url}; retrying in {delay:.2f}s")
+            time.sleep(delay)
+
+        return response
 
     def get(
         self,
         path: str,
         params: Optional[dict] = None,
         accept: str = "application/xml",
+        extra_headers: Optional[dict] = None,
     ) -> requests.Response:
         """Make a GET request to the API.
-        
+
         Args:
             path: API path (will be appended to BASE_URL).
             params: Query parameters.
             accept: Accept header value.
-        
+            extra_headers: Additional request headers (e.g. If-None-Match).
+
         Returns:
             Response object.
-        
+
         Raises:
             requests.RequestException: On network errors after retries.
         """
-        self._wait_if_needed()
-
         url = f"{self.BASE_URL}{path}" if path.startswith("/") else f"{self.BASE_URL}/{path}"
         headers = {"Accept": accept}
+        if extra_headers:
+            headers.update(extra_headers)
 
         logger.debug(f"GET {url} (Accept: {accept})")
 
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            self._last_request_time = time.time()
+            response = self._request_with_retry(url, params=params, headers=headers)
 
             if response.status_code == 429:
-                logger.warning("Rate limited (429). Retry should have handled this.")
+                logger.warning("Rate limited (429) after retries.")
             elif response.status_code >= 400:
                 logger.warning(f"HTTP {response.status_code} for {url}")
             else:
@@ -117,16 +230,52 @@ class FinlexClient:
 
         except requests.RequestException as e:
             logger.error(f"Request failed: {e}")
-            self._last_request_time = time.time()
             raise
 
+    @contextmanager
+    def get_stream(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        accept: str = "application/octet-stream",
+    ) -> Iterator[requests.Response]:
+        """Make a GET request with a streaming response body.
+
+        The body is not read into memory; callers iterate it in chunks
+        (e.g. ``response.iter_content(65536)``) and write directly to disk.
+
+        Args:
+            path: API path (will be appended to BASE_URL).
+            params: Query parameters.
+            accept: Accept header value.
+
+        Yields:
+            Streaming Response object, closed when the context exits.
+        """
+        url = f"{self.BASE_URL}{path}" if path.startswith("/") else f"{self.BASE_URL}/{path}"
+        headers = {"Accept": accept}
+
+        logger.debug(f"GET {url} (Accept: {accept}, streaming)")
+
+        response = self._request_with_retry(url, params=params, headers=headers, stream=True)
+        response.raw.decode_content = True
+        try:
+            yield response
+        finally:
+            response.close()
+
     def get_json(self, path: str, params: Optional[dict] = None) -> requests.Response:
         """Make a GET request expecting JSON response."""
         return self.get(path, params=params, accept="application/json")
 
-    def get_xml(self, path: str, params: Optional[dict] = None) -> requests.Response:
+    def get_xml(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        extra_headers: Optional[dict] = None,
+    ) -> requests.Response:
         """Make a GET request expecting XML response."""
-        return self.get(path, params=params, accept="application/xml")
+        return self.get(path, params=params, accept="application/xml", extra_headers=extra_headers)
 
     def get_pdf(self, path: str, params: Optional[dict] = None) -> requests.Response:
         """Make a GET request for PDF content."""
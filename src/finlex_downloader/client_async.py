@@ -0,0 +1,197 @@
+"""Async HTTP client for Finlex Open Data API built on aiohttp."""
+
+import asyncio
+import random
+from typing import Optional
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from .client import TokenBucket
+from .logging_config import logger
+
+# Status codes worth retrying, mirroring the sync client's retry strategy
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncFinlexClient:
+    """Async HTTP client for Finlex Open Data API.
+
+    Features:
+    - Automatic User-Agent header
+    - Retry with exponential backoff for 429, 5xx, timeouts
+    - Global rate limiting shared across concurrent requests
+    - Bounded connection pool sized to the configured concurrency
+    """
+
+    BASE_URL = "https://opendata.finlex.fi/finlex/avoindata/v1"
+    USER_AGENT = "finlex-downloader/0.1.0"
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        sleep_seconds: float = 5.0,
+        max_retries: int = 5,
+        backoff_factor: float = 1.0,
+        timeout: float = 30.0,
+        rate: Optional[float] = None,
+        interval: float = 60.0,
+        bucket: Optional[TokenBucket] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            concurrency: Maximum concurrent connections.
+            sleep_seconds: Legacy pacing; translated to a 1-per-sleep_seconds
+                rate when no explicit rate is given.
+            max_retries: Maximum retry attempts for failed requests.
+            backoff_factor: Multiplier for exponential backoff.
+            timeout: Request timeout in seconds.
+            rate: Requests allowed per interval (overrides sleep_seconds).
+            interval: Rate limit interval in seconds.
+            bucket: Shared TokenBucket to draw from instead of an own
+                limiter, so several clients (e.g. one per doc-type
+                worker thread) stay within one combined quota.
+        """
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        # Shared limiter: honored by all concurrent tasks, unlike a
+        # per-connection sleep. With no external bucket, the same
+        # rate/interval fallback as the sync client so the flags
+        # throttle identically at any concurrency.
+        self._bucket = bucket
+        if bucket is not None:
+            self._limiter: Optional[AsyncLimiter] = None
+        elif rate is not None:
+            self._limiter = AsyncLimiter(rate, interval)
+        elif sleep_seconds > 0:
+            self._limiter = AsyncLimiter(1.0, sleep_seconds)
+        else:
+            self._limiter = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _acquire(self) -> None:
+        """Wait for the rate limiter before a request.
+
+        A shared TokenBucket blocks, so it is acquired in a worker
+        thread; every event loop drawing from it then competes for the
+        same tokens as the sync client.
+        """
+        if self._bucket is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._bucket.acquire)
+        elif self._limiter is not None:
+            await self._limiter.acquire()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the session lazily so the client can be built outside a loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "User-Agent": self.USER_AGENT,
+                    "Accept-Encoding": "gzip",
+                },
+            )
+        return self._session
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        accept: str = "application/xml",
+        extra_headers: Optional[dict] = None,
+    ) -> tuple[int, bytes, dict]:
+        """Make a GET request to the API.
+
+        Args:
+            path: API path (will be appended to BASE_URL).
+            params: Query parameters.
+            accept: Accept header value.
+            extra_headers: Additional request headers (e.g. If-None-Match).
+
+        Returns:
+            Tuple of (status code, response body, response headers).
+
+        Raises:
+            aiohttp.ClientError: On network errors after retries.
+        """
+        session = await self._ensure_session()
+        url = f"{self.BASE_URL}{path}" if path.startswith("/") else f"{self.BASE_URL}/{path}"
+        headers = {"Accept": accept}
+        if extra_headers:
+            headers.update(extra_headers)
+
+        last_error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            await self._acquire()
+            logger.debug(f"GET {url} (Accept: {accept}, attempt {attempt + 1})")
+            try:
+                async with session.get(url, params=params, headers=headers) as response:
+                    # Getting a response clears any earlier network error,
+                    # so exhausting retries on 5xx returns the final status
+                    # instead of raising a stale exception
+                    last_error = None
+                    body = await response.read()
+                    if response.status not in RETRY_STATUSES:
+                        if response.status >= 400:
+                            logger.warning(f"HTTP {response.status} for {url}")
+                        else:
+                            logger.debug(f"HTTP {response.status}, {len(body)} bytes")
+                        return response.status, body, dict(response.headers)
+
+                    retry_after = response.headers.get("Retry-After")
+                    logger.warning(f"HTTP {response.status} for {url}, retrying")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+                retry_after = None
+                logger.warning(f"Request failed: {e}, retrying")
+
+            if attempt < self.max_retries:
+                # Retry-After may be an HTTP-date rather than seconds
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = self.backoff_factor * (2 ** attempt)
+                delay += random.uniform(0, 0.25)
+                await asyncio.sleep(delay)
+
+        if last_error is not None:
+            logger.error(f"Request failed after {self.max_retries} retries: {last_error}")
+            raise last_error
+        return response.status, body, dict(response.headers)
+
+    async def get_json(self, path: str, params: Optional[dict] = None) -> tuple[int, bytes, dict]:
+        """Make a GET request expecting JSON response."""
+        return await self.get(path, params=params, accept="application/json")
+
+    async def get_xml(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        extra_headers: Optional[dict] = None,
+    ) -> tuple[int, bytes, dict]:
+        """Make a GET request expecting XML response."""
+        return await self.get(path, params=params, accept="application/xml", extra_headers=extra_headers)
+
+    async def get_pdf(self, path: str, params: Optional[dict] = None) -> tuple[int, bytes, dict]:
+        """Make a GET request for PDF content."""
+        return await self.get(path, params=params, accept="application/pdf")
+
+    async def get_zip(self, path: str, params: Optional[dict] = None) -> tuple[int, bytes, dict]:
+        """Make a GET request for ZIP content."""
+        return await self.get(path, params=params, accept="application/zip")
+
+    async def close(self) -> None:
+        """Close the session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncFinlexClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -1,15 +1,18 @@
 """Document downloader for Finlex Open Data."""
 
 import json
+import os
+import shutil
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
-from lxml import etree
-
 from .client import FinlexClient
 from .logging_config import logger
+from .state import ManifestEntry
 from .urls import DocumentInfo, parse_akn_uri, build_api_path
 
 
@@ -18,10 +21,12 @@ class DownloadResult:
     """Result of a single download operation."""
 
     akn_uri: str
-    status: str  # success, skipped, error
+    status: str  # success, skipped, not-modified, error
     timestamp: str
     files: list[str] = field(default_factory=list)
     error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 @dataclass
@@ -37,28 +42,108 @@ class DownloadOptions:
 
 
 # Akoma Ntoso namespace
-AKN_NS = {"akn": "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"}
+_AKN_URI = "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"
+AKN_NS = {"akn": _AKN_URI}
+
+# Clark-notation tags precomputed once for the iterparse filter
+_TAG_IMG, _TAG_ATTACHMENT, _TAG_REF = (
+    f"{{{_AKN_URI}}}{t}" for t in ("img", "attachment", "ref")
+)
+
+
+# Buffer size for streaming large bodies to disk; os.sendfile is not an
+# option here because response.raw is backed by the HTTP(S) socket, not
+# an mmap-able file, and raw socket bytes would bypass chunked framing
+# and TLS decryption anyway
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string, without microseconds."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(timespec="seconds")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically.
+
+    Writes to a sibling temp file, fsyncs, then renames into place so an
+    interrupted run never leaves a truncated file that a later resume
+    would treat as complete.
+
+    Args:
+        path: Final destination path.
+        data: Bytes to write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def stream_to_file(
+    client: FinlexClient,
+    api_path: str,
+    accept: str,
+    dest: Path,
+) -> int:
+    """Stream a response body directly to a file.
+
+    Keeps peak memory at one buffer instead of the full payload, which
+    matters for multi-MB PDF/ZIP attachments.
+
+    Args:
+        client: HTTP client instance.
+        api_path: API path to fetch.
+        accept: Accept header value.
+        dest: Destination file path.
+
+    Returns:
+        HTTP status code; the file is written only on 200.
+    """
+    tmp = dest.with_suffix(dest.suffix + ".tmp")
+    with client.get_stream(api_path, accept=accept) as response:
+        if response.status_code == 200:
+            try:
+                with open(tmp, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, dest)
+            except Exception:
+                tmp.unlink(missing_ok=True)
+                raise
+        return response.status_code
 
 
 def download_document(
     client: FinlexClient,
     akn_uri: str,
     options: DownloadOptions,
+    prior: Optional[ManifestEntry] = None,
 ) -> DownloadResult:
     """Download a single document and its assets.
-    
+
     Args:
         client: HTTP client instance.
         akn_uri: Document URI from list endpoint.
         options: Download options.
-    
+        prior: Previous manifest entry for this URI; its validators are
+            sent as a conditional GET so an unchanged document costs a
+            304 instead of a full re-download.
+
     Returns:
         DownloadResult with status and file paths.
     """
     result = DownloadResult(
         akn_uri=akn_uri,
         status="error",
-        timestamp=datetime.now().isoformat(),
+        timestamp=utc_timestamp(),
     )
 
     # Parse URI to get document info
@@ -68,12 +153,19 @@ def download_document(
         logger.error(result.error)
         return result
 
-    # Create output directory
-    doc_dir = options.output_dir / info.folder_path
+    # Check which artifacts are actually missing, not just the XML, so a
+    # resumed run with --pdf/--zip/--media only fetches what it lacks
+    # One join + one Path parse instead of pathlib composing six segments
+    doc_dir = Path(os.path.join(options.output_dir, info.folder_str))
     xml_path = doc_dir / "main.xml"
+    pdf_path = doc_dir / "main.pdf"
+    zip_path = doc_dir / "main.zip"
+
+    have_xml = xml_path.exists() and not options.force
+    need_pdf = options.fetch_pdf and (options.force or not pdf_path.exists())
+    need_zip = options.fetch_zip and (options.force or not zip_path.exists())
 
-    # Check if already exists
-    if xml_path.exists() and not options.force:
+    if have_xml and not need_pdf and not need_zip and not options.fetch_media:
         result.status = "skipped"
         result.files.append(str(xml_path))
         logger.info(f"Skipping existing: {xml_path}")
@@ -88,54 +180,86 @@ def download_document(
     # Create directory
     doc_dir.mkdir(parents=True, exist_ok=True)
 
-    # Fetch XML
-    api_path = build_api_path(info)
-    try:
-        response = client.get_xml(api_path)
-        if response.status_code != 200:
-            result.error = f"HTTP {response.status_code} fetching XML"
-            logger.error(result.error)
-            return result
+    fetched = False
 
-        xml_content = response.content
-        xml_path.write_bytes(xml_content)
+    # Fetch XML, or reuse the local copy when only other artifacts are missing
+    api_path = build_api_path(info)
+    if have_xml:
+        xml_content = xml_path.read_bytes()
         result.files.append(str(xml_path))
-        logger.info(f"Downloaded XML: {xml_path}")
+    else:
+        # Only send validators when a local copy exists to fall back on;
+        # a 304 with no file on disk would leave us without content
+        extra_headers: Optional[dict] = None
+        if prior is not None and xml_path.exists():
+            extra_headers = {}
+            if prior.etag:
+                extra_headers["If-None-Match"] = prior.etag
+            if prior.last_modified:
+                extra_headers["If-Modified-Since"] = prior.last_modified
+            extra_headers = extra_headers or None
 
-    except Exception as e:
-        result.error = f"Failed to fetch XML: {e}"
-        logger.error(result.error)
-        return result
+        try:
+            response = client.get_xml(api_path, extra_headers=extra_headers)
+            if response.status_code == 304:
+                # A 304 is only meaningful when we sent validators; a
+                # server returning one unprompted must not mark the
+                # document complete with nothing on disk
+                if extra_headers is None:
+                    result.error = "HTTP 304 without validators sent"
+                    logger.error(f"{result.error}: {akn_uri}")
+                    return result
+                result.status = "not-modified"
+                result.files = list(prior.files)
+                result.etag = prior.etag
+                result.last_modified = prior.last_modified
+                logger.info(f"Not modified on server: {akn_uri}")
+                return result
+            if response.status_code != 200:
+                result.error = f"HTTP {response.status_code} fetching XML"
+                logger.error(result.error)
+                return result
+
+            xml_content = response.content
+            atomic_write_bytes(xml_path, xml_content)
+            result.files.append(str(xml_path))
+            result.etag = response.headers.get("ETag")
+            result.last_modified = response.headers.get("Last-Modified")
+            fetched = True
+            logger.info(f"Downloaded XML: {xml_path}")
 
-    # Fetch PDF if requested
-    if options.fetch_pdf:
-        pdf_path = doc_dir / "main.pdf"
+        except Exception as e:
+            result.error = f"Failed to fetch XML: {e}"
+            logger.error(result.error)
+            return result
+
+    # Fetch PDF if requested and missing
+    if need_pdf:
         try:
-            response = client.get_pdf(f"{api_path}/main.pdf")
-            if response.status_code == 200:
-                pdf_path.write_bytes(response.content)
+            status = stream_to_file(client, f"{api_path}/main.pdf", "application/pdf", pdf_path)
+            if status == 200:
                 result.files.append(str(pdf_path))
+                fetched = True
                 logger.info(f"Downloaded PDF: {pdf_path}")
-            elif response.status_code != 404:
-                logger.warning(f"PDF fetch returned HTTP {response.status_code}")
+            elif status != 404:
+                logger.warning(f"PDF fetch returned HTTP {status}")
         except Exception as e:
             logger.warning(f"Failed to fetch PDF: {e}")
 
-    # Fetch ZIP if requested
-    if options.fetch_zip:
-        zip_path = doc_dir / "main.zip"
+    # Fetch ZIP if requested and missing
+    if need_zip:
         try:
-            response = client.get_zip(f"{api_path}/main.akn")
-            if response.status_code == 200:
-                zip_path.write_bytes(response.content)
+            status = stream_to_file(client, f"{api_path}/main.akn", "application/zip", zip_path)
+            if status == 200:
                 result.files.append(str(zip_path))
+                fetched = True
                 logger.info(f"Downloaded ZIP: {zip_path}")
-            elif response.status_code != 404:
-                logger.warning(f"ZIP fetch returned HTTP {response.status_code}")
+            elif status != 404:
+                logger.warning(f"ZIP fetch returned HTTP {status}")
         except Exception as e:
             logger.warning(f"Failed to fetch ZIP: {e}")
 
-    # Fetch media if requested
+    # Fetch media if requested, skipping files already on disk
     if options.fetch_media:
         media_links = extract_media_links(xml_content)
         if media_links:
@@ -143,16 +267,18 @@ def download_document(
             media_dir.mkdir(exist_ok=True)
             for link in media_links:
                 media_path = media_dir / Path(link).name
+                if media_path.exists() and not options.force:
+                    continue
                 try:
-                    response = client.get(f"{api_path}/{link}")
-                    if response.status_code == 200:
-                        media_path.write_bytes(response.content)
+                    status = stream_to_file(client, f"{api_path}/{link}", "application/octet-stream", media_path)
+                    if status == 200:
                         result.files.append(str(media_path))
+                        fetched = True
                         logger.info(f"Downloaded media: {media_path}")
                 except Exception as e:
                     logger.warning(f"Failed to fetch media {link}: {e}")
 
-    result.status = "success"
+    result.status = "success" if fetched else "skipped"
     return result
 
 
@@ -165,26 +291,37 @@ def extract_media_links(xml_content: bytes) -> list[str]:
     Returns:
         List of relative media paths (e.g., ["media/123.gif"]).
     """
+    # Imported here so CLI startup doesn't pay for lxml unless media
+    # extraction actually runs
+    from lxml import etree
+
     links = []
+    append = links.append  # avoid repeated attribute lookup in the loop
     try:
-        tree = etree.fromstring(xml_content)
-        
-        # Look for img elements
-        for img in tree.xpath("//akn:img/@src", namespaces=AKN_NS):
-            if img.startswith("media/"):
-                links.append(img)
-        
-        # Look for attachments with href
-        for href in tree.xpath("//akn:attachment//@href", namespaces=AKN_NS):
-            if href.startswith("media/"):
-                links.append(href)
-        
-        # Look for ref elements pointing to media
-        for ref in tree.xpath("//akn:ref/@href", namespaces=AKN_NS):
-            if ref.startswith("media/"):
-                links.append(ref)
+        # Single streaming pass instead of building a full DOM and
+        # walking it once per XPath; elements are freed as we go and
+        # non-media values are rejected on a cheap slice compare
+        context = etree.iterparse(
+            BytesIO(xml_content),
+            events=("end",),
+            tag=(_TAG_IMG, _TAG_ATTACHMENT, _TAG_REF),
+        )
+        for _, el in context:
+            src = el.get("src")
+            if src is not None and src[:6] == "media/":
+                append(src)
+            href = el.get("href")
+            if href is not None and href[:6] == "media/":
+                append(href)
+            if el.tag == _TAG_ATTACHMENT:
+                # Attachment hrefs may sit on non-filtered descendants
+                for child in el.iterdescendants():
+                    href = child.get("href")
+                    if href is not None and href[:6] == "media/":
+                        append(href)
+            el.clear(keep_tail=True)
 
     except Exception as e:
         logger.warning(f"Failed to parse XML for media links: {e}")
 
-    return list(set(links))  # Deduplicate
+    return list(dict.fromkeys(links))  # Deduplicate, preserving order
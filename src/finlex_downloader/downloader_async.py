@@ -0,0 +1,184 @@
+"""Async document downloader for Finlex Open Data."""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from .client_async import AsyncFinlexClient
+from .downloader import (
+    DownloadOptions,
+    DownloadResult,
+    atomic_write_bytes,
+    extract_media_links,
+    utc_timestamp,
+)
+from .logging_config import logger
+from .state import ManifestEntry
+from .urls import parse_akn_uri, build_api_path
+
+
+async def download_document_async(
+    client: AsyncFinlexClient,
+    akn_uri: str,
+    options: DownloadOptions,
+    prior: Optional[ManifestEntry] = None,
+) -> DownloadResult:
+    """Download a single document and its assets concurrently-safe.
+
+    Mirrors the synchronous download_document — per-artifact existence
+    checks, conditional-GET revalidation against the prior manifest
+    entry, skipping media already on disk — but uses the async client,
+    so many documents can be in flight under one rate limiter.
+
+    Args:
+        client: Async HTTP client instance.
+        akn_uri: Document URI from list endpoint.
+        options: Download options.
+        prior: Previous manifest entry for this URI; its validators are
+            sent as a conditional GET so an unchanged document costs a
+            304 instead of a full re-download.
+
+    Returns:
+        DownloadResult with status and file paths.
+    """
+    result = DownloadResult(
+        akn_uri=akn_uri,
+        status="error",
+        timestamp=utc_timestamp(),
+    )
+
+    info = parse_akn_uri(akn_uri)
+    if not info:
+        result.error = f"Failed to parse URI: {akn_uri}"
+        logger.error(result.error)
+        return result
+
+    # Check which artifacts are actually missing, not just the XML, so a
+    # resumed run with --pdf/--zip/--media only fetches what it lacks
+    doc_dir = Path(os.path.join(options.output_dir, info.folder_str))
+    xml_path = doc_dir / "main.xml"
+    pdf_path = doc_dir / "main.pdf"
+    zip_path = doc_dir / "main.zip"
+
+    have_xml = xml_path.exists() and not options.force
+    need_pdf = options.fetch_pdf and (options.force or not pdf_path.exists())
+    need_zip = options.fetch_zip and (options.force or not zip_path.exists())
+
+    if have_xml and not need_pdf and not need_zip and not options.fetch_media:
+        result.status = "skipped"
+        result.files.append(str(xml_path))
+        logger.info(f"Skipping existing: {xml_path}")
+        return result
+
+    if options.dry_run:
+        result.status = "dry-run"
+        logger.info(f"[DRY-RUN] Would download: {akn_uri}")
+        logger.info(f"[DRY-RUN] To: {doc_dir}")
+        return result
+
+    doc_dir.mkdir(parents=True, exist_ok=True)
+
+    fetched = False
+
+    # Fetch XML, or reuse the local copy when only other artifacts are missing
+    api_path = build_api_path(info)
+    if have_xml:
+        xml_content = xml_path.read_bytes()
+        result.files.append(str(xml_path))
+    else:
+        # Only send validators when a local copy exists to fall back on;
+        # a 304 with no file on disk would leave us without content
+        extra_headers: Optional[dict] = None
+        if prior is not None and xml_path.exists():
+            extra_headers = {}
+            if prior.etag:
+                extra_headers["If-None-Match"] = prior.etag
+            if prior.last_modified:
+                extra_headers["If-Modified-Since"] = prior.last_modified
+            extra_headers = extra_headers or None
+
+        try:
+            status, xml_content, resp_headers = await client.get_xml(
+                api_path, extra_headers=extra_headers
+            )
+            if status == 304:
+                # A 304 is only meaningful when we sent validators; a
+                # server returning one unprompted must not mark the
+                # document complete with nothing on disk
+                if extra_headers is None:
+                    result.error = "HTTP 304 without validators sent"
+                    logger.error(f"{result.error}: {akn_uri}")
+                    return result
+                result.status = "not-modified"
+                result.files = list(prior.files)
+                result.etag = prior.etag
+                result.last_modified = prior.last_modified
+                logger.info(f"Not modified on server: {akn_uri}")
+                return result
+            if status != 200:
+                result.error = f"HTTP {status} fetching XML"
+                logger.error(result.error)
+                return result
+
+            atomic_write_bytes(xml_path, xml_content)
+            result.files.append(str(xml_path))
+            result.etag = resp_headers.get("ETag")
+            result.last_modified = resp_headers.get("Last-Modified")
+            fetched = True
+            logger.info(f"Downloaded XML: {xml_path}")
+
+        except Exception as e:
+            result.error = f"Failed to fetch XML: {e}"
+            logger.error(result.error)
+            return result
+
+    # Fetch PDF if requested and missing
+    if need_pdf:
+        try:
+            status, content, _ = await client.get_pdf(f"{api_path}/main.pdf")
+            if status == 200:
+                atomic_write_bytes(pdf_path, content)
+                result.files.append(str(pdf_path))
+                fetched = True
+                logger.info(f"Downloaded PDF: {pdf_path}")
+            elif status != 404:
+                logger.warning(f"PDF fetch returned HTTP {status}")
+        except Exception as e:
+            logger.warning(f"Failed to fetch PDF: {e}")
+
+    # Fetch ZIP if requested and missing
+    if need_zip:
+        try:
+            status, content, _ = await client.get_zip(f"{api_path}/main.akn")
+            if status == 200:
+                atomic_write_bytes(zip_path, content)
+                result.files.append(str(zip_path))
+                fetched = True
+                logger.info(f"Downloaded ZIP: {zip_path}")
+            elif status != 404:
+                logger.warning(f"ZIP fetch returned HTTP {status}")
+        except Exception as e:
+            logger.warning(f"Failed to fetch ZIP: {e}")
+
+    # Fetch media if requested, skipping files already on disk
+    if options.fetch_media:
+        media_links = extract_media_links(xml_content)
+        if media_links:
+            media_dir = doc_dir / "media"
+            media_dir.mkdir(exist_ok=True)
+            for link in media_links:
+                media_path = media_dir / Path(link).name
+                if media_path.exists() and not options.force:
+                    continue
+                try:
+                    status, content, _ = await client.get(f"{api_path}/{link}")
+                    if status == 200:
+                        atomic_write_bytes(media_path, content)
+                        result.files.append(str(media_path))
+                        fetched = True
+                        logger.info(f"Downloaded media: {media_path}")
+                except Exception as e:
+                    logger.warning(f"Failed to fetch media {link}: {e}")
+
+    result.status = "success" if fetched else "skipped"
+    return result
@@ -1,9 +1,12 @@
 """Listing functionality for Finlex documents."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Iterator, Optional
 
+import orjson
+
 from .client import FinlexClient
 from .logging_config import logger
 from .urls import build_list_path
@@ -51,79 +54,115 @@ DOCUMENT_TYPES = {
     ],
 }
 
+# CLI category -> (actual API category, doc types); authority-regulation
+# is exposed as its own CLI category but lives under "doc" in the API
+CATEGORY_MAP: dict[str, tuple[str, list[str]]] = {
+    "act": ("act", DOCUMENT_TYPES["act"]),
+    "judgment": ("judgment", DOCUMENT_TYPES["judgment"]),
+    "doc": ("doc", DOCUMENT_TYPES["doc"]),
+    "authority-regulation": ("doc", ["authority-regulation"]),
+}
+
 
 def list_documents(
     client: FinlexClient,
     config: ListConfig,
 ) -> Iterator[ListItem]:
     """Fetch document list from API with paging.
-    
+
+    The next page is requested in a background thread while the current
+    page's items are being consumed, so the list-request latency is
+    overlapped with download work. The prefetch goes through the shared
+    client and therefore respects its rate limiter.
+
     Args:
         client: HTTP client instance.
         config: List configuration.
-    
+
     Yields:
         ListItem for each document found.
     """
     path = build_list_path(config.category, config.document_type)
-    page = 1
 
-    while True:
-        if config.max_pages and page > config.max_pages:
-            logger.info(f"Reached max pages ({config.max_pages})")
-            break
+    # Only the page number changes between requests; build the rest once
+    base_params = {
+        "format": "json",
+        "limit": config.limit,
+        "langAndVersion": config.lang_and_version,
+    }
+    if config.start_year:
+        base_params["startYear"] = config.start_year
+    if config.end_year:
+        base_params["endYear"] = config.end_year
+
+    def fetch(page: int):
+        logger.info(f"Fetching {config.category}/{config.document_type} page {page}")
+        return client.get_json(path, params={**base_params, "page": page})
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = 1
+        future = executor.submit(fetch, page)
 
-        params = {
-            "format": "json",
-            "page": page,
-            "limit": config.limit,
-            "langAndVersion": config.lang_and_version,
-        }
+        while True:
+            if config.max_pages and page > config.max_pages:
+                logger.info(f"Reached max pages ({config.max_pages})")
+                break
 
-        if config.start_year:
-            params["startYear"] = config.start_year
-        if config.end_year:
-            params["endYear"] = config.end_year
+            response = future.result()
 
-        logger.info(f"Fetching {config.category}/{config.document_type} page {page}")
-        response = client.get_json(path, params=params)
-
-        if response.status_code != 200:
-            logger.error(f"List request failed: HTTP {response.status_code}")
-            break
-
-        try:
-            items = response.json()
-        except ValueError:
-            logger.error("Failed to parse JSON response")
-            break
-
-        if not items:
-            logger.info("No more items, pagination complete")
-            break
-
-        for item in items:
-            yield ListItem(
-                akn_uri=item.get("akn_uri", ""),
-                status=item.get("status", ""),
+            if response.status_code != 200:
+                logger.error(f"List request failed: HTTP {response.status_code}")
+                break
+
+            try:
+                items = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                logger.error("Failed to parse JSON response")
+                break
+
+            if not items:
+                logger.info("No more items, pagination complete")
+                break
+
+            # Fewer items than limit means this is the last page
+            last_page = len(items) < config.limit or (
+                config.max_pages and page + 1 > config.max_pages
             )
 
-        # If we got fewer items than limit, we're on the last page
-        if len(items) < config.limit:
-            logger.info(f"Last page reached ({len(items)} items)")
-            break
+            # Kick off the next page before yielding so it downloads
+            # while the caller processes the current batch
+            if not last_page:
+                future = executor.submit(fetch, page + 1)
+
+            for item in items:
+                yield ListItem(
+                    akn_uri=item.get("akn_uri", ""),
+                    status=item.get("status", ""),
+                )
+
+            if last_page:
+                if len(items) < config.limit:
+                    logger.info(f"Last page reached ({len(items)} items)")
+                break
 
-        page += 1
+            page += 1
+    finally:
+        executor.shutdown(wait=False)
+
+
+# Resolved once per process; a CLI run does not straddle year boundaries
+# in any way that matters for listing windows
+_CURRENT_YEAR = datetime.now().year
 
 
 def get_year_range(years_back: int) -> tuple[int, int]:
     """Calculate year range from current year.
-    
+
     Args:
         years_back: Number of years to go back.
-    
+
     Returns:
         Tuple of (start_year, end_year).
     """
-    current_year = datetime.now().year
-    return (current_year - years_back + 1, current_year)
+    return (_CURRENT_YEAR - years_back + 1, _CURRENT_YEAR)
@@ -1,102 +1,298 @@
 """State management for resumable downloads."""
 
+import atexit
 import json
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from hashlib import blake2b
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from .logging_config import logger
 
 
-@dataclass
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string without microseconds.
+
+    Cheaper than the default isoformat() and stamped only at save time,
+    not per document.
+    """
+    return datetime.now(tz=timezone.utc).isoformat(timespec="seconds")
+
+
+def _fingerprint(uri: str) -> bytes:
+    """64-bit BLAKE2b fingerprint of a URI.
+
+    The completed set is only ever probed for membership, so 8 bytes per
+    entry replace ~130-byte URI string objects. Collision odds at a
+    million entries are around 3e-8 — fine for a download-skip cache.
+    """
+    return blake2b(uri.encode(), digest_size=8).digest()
+
+
+class _BloomFilter:
+    """Bloom filter over 64-bit URI fingerprints.
+
+    Fronts the completed set with a fixed 1 MiB bit array so the common
+    "definitely not completed" answer costs a few bit probes in cache-
+    resident memory instead of a hash lookup into a growing set. Only
+    possible hits fall through to the exact set.
+    """
+
+    def __init__(self, size_bits: int = 1 << 23, hashes: int = 7):
+        """Initialize an empty filter.
+
+        Args:
+            size_bits: Number of bits in the array (default 1 MiB).
+            hashes: Probes per element.
+        """
+        self._size = size_bits
+        self._hashes = hashes
+        self._bits = bytearray(size_bits >> 3)
+
+    def add(self, fp: bytes) -> None:
+        """Set the bits for a fingerprint."""
+        h = int.from_bytes(fp, "little")
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        bits = self._bits
+        size = self._size
+        for i in range(self._hashes):
+            idx = (h1 + i * h2) % size
+            bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, fp: bytes) -> bool:
+        h = int.from_bytes(fp, "little")
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        bits = self._bits
+        size = self._size
+        for i in range(self._hashes):
+            idx = (h1 + i * h2) % size
+            if not bits[idx >> 3] & (1 << (idx & 7)):
+                return False
+        return True
+
+
+def _decode_completed(value: str) -> bytes:
+    """Decode a serialized completed-set member.
+
+    Accepts the current hex-fingerprint form as well as raw URIs from
+    state written before fingerprinting.
+    """
+    if len(value) == 16:
+        try:
+            return bytes.fromhex(value)
+        except ValueError:
+            pass
+    return _fingerprint(value)
+
+
+@dataclass(slots=True)
 class DownloadState:
     """State tracking for resumable downloads."""
 
-    # Current progress
-    current_category: Optional[str] = None
-    current_document_type: Optional[str] = None
-    current_page: int = 1
+    # Current progress: one resume page per "category/doc_type" key, so
+    # parallel doc-type workers don't clobber a single shared pointer
+    pages: dict[str, int] = field(default_factory=dict)
     last_uri: Optional[str] = None
     
-    # Completed tracking
-    completed_uris: set[str] = field(default_factory=set)
+    # Completed tracking (64-bit URI fingerprints, see _fingerprint)
+    completed_uris: set[bytes] = field(default_factory=set)
     
     # Timestamps
     started_at: Optional[str] = None
     updated_at: Optional[str] = None
 
-    def to_dict(self) -> dict:
-        """Convert to JSON-serializable dict."""
+    def to_pointer_dict(self) -> dict:
+        """Convert just the small pointer fields to a dict.
+
+        This is what the hot save path serializes; the completed set is
+        excluded because it lives in the append-only log and listing it
+        here would allocate a fresh list per save.
+        """
         return {
-            "current_category": self.current_category,
-            "current_document_type": self.current_document_type,
-            "current_page": self.current_page,
+            "pages": self.pages,
             "last_uri": self.last_uri,
-            "completed_uris": list(self.completed_uris),
             "started_at": self.started_at,
             "updated_at": self.updated_at,
         }
 
+    def to_dict(self) -> dict:
+        """Convert to a full JSON-serializable dict, completed set included."""
+        d = self.to_pointer_dict()
+        d["completed_uris"] = [fp.hex() for fp in self.completed_uris]
+        return d
+
     @classmethod
     def from_dict(cls, data: dict) -> "DownloadState":
         """Create from dict."""
+        pages = dict(data.get("pages", {}))
+        # Legacy single-pointer state folds into the per-type map
+        category = data.get("current_category")
+        doc_type = data.get("current_document_type")
+        if category and doc_type and not pages:
+            pages[f"{category}/{doc_type}"] = data.get("current_page", 1)
         return cls(
-            current_category=data.get("current_category"),
-            current_document_type=data.get("current_document_type"),
-            current_page=data.get("current_page", 1),
+            pages=pages,
             last_uri=data.get("last_uri"),
-            completed_uris=set(data.get("completed_uris", [])),
+            completed_uris={_decode_completed(v) for v in data.get("completed_uris", [])},
             started_at=data.get("started_at"),
             updated_at=data.get("updated_at"),
         )
 
 
 class StateManager:
-    """Manages download state for resumability."""
+    """Manages download state for resumability.
 
-    def __init__(self, state_file: Path):
+    Pointer state (per-type resume pages, last URI) lives in a small
+    ``state.json`` that is saved on a debounced schedule: every
+    ``flush_every_n`` changes or ``flush_interval_secs`` seconds.
+    Completed URIs go to an append-only ``completed.log`` sidecar, one
+    hex fingerprint per line, so each completion costs one short write
+    instead of re-serializing the whole completed set.
+    """
+
+    def __init__(
+        self,
+        state_file: Path,
+        flush_every_n: int = 50,
+        flush_interval_secs: float = 5.0,
+    ):
         """Initialize state manager.
-        
+
         Args:
             state_file: Path to state.json file.
+            flush_every_n: Save after this many buffered mutations.
+            flush_interval_secs: Save at least this often while mutating.
         """
         self.state_file = state_file
+        # Plain log, not .jsonl: the lines are bare hex fingerprints,
+        # not JSON values
+        self.completed_file = state_file.parent / "completed.log"
         self.state = DownloadState()
+        self.flush_every_n = flush_every_n
+        self.flush_interval_secs = flush_interval_secs
+        self._dirty_count = 0
+        self._last_flush = time.monotonic()
+        self._bloom = _BloomFilter()
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._completed_log = open(self.completed_file, "a", buffering=1 << 16)
+
+        # Make sure buffered progress survives interpreter exit
+        atexit.register(self.close)
 
     def load(self) -> bool:
-        """Load state from file.
-        
+        """Load state from disk.
+
+        Reads pointer state from state.json and completed URIs from the
+        completed.log sidecar (plus any legacy completed_uris embedded
+        in an old-format state.json, or a pre-rename completed.jsonl).
+
         Returns:
-            True if state was loaded, False if no state file exists.
+            True if any state was loaded, False if starting fresh.
         """
-        if not self.state_file.exists():
-            logger.info("No existing state file found")
-            return False
+        loaded = False
 
-        try:
-            with open(self.state_file) as f:
-                data = json.load(f)
-            self.state = DownloadState.from_dict(data)
-            logger.info(f"Loaded state: page {self.state.current_page}, {len(self.state.completed_uris)} completed")
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to load state file: {e}")
-            return False
+        if self.state_file.exists():
+            try:
+                with open(self.state_file) as f:
+                    data = json.load(f)
+                self.state = DownloadState.from_dict(data)
+                loaded = True
+            except Exception as e:
+                logger.warning(f"Failed to load state file: {e}")
+
+        if self.completed_file.exists():
+            try:
+                with open(self.completed_file) as f:
+                    fingerprints = {_decode_completed(line.rstrip("\n")) for line in f if line.strip()}
+                # An empty log is created eagerly; it isn't prior state
+                if fingerprints:
+                    self.state.completed_uris.update(fingerprints)
+                    loaded = True
+            except Exception as e:
+                logger.warning(f"Failed to read completion log: {e}")
+
+        # Migrate a pre-rename completed.jsonl sidecar into the log
+        legacy_log = self.state_file.parent / "completed.jsonl"
+        if legacy_log.exists():
+            try:
+                with open(legacy_log) as f:
+                    fingerprints = {_decode_completed(line.rstrip("\n")) for line in f if line.strip()}
+                if fingerprints:
+                    for fp in fingerprints:
+                        self._completed_log.write(fp.hex() + "\n")
+                    self._completed_log.flush()
+                    self.state.completed_uris.update(fingerprints)
+                    loaded = True
+                legacy_log.unlink()
+            except Exception as e:
+                logger.warning(f"Failed to migrate legacy completion log: {e}")
+
+        if loaded:
+            for fp in self.state.completed_uris:
+                self._bloom.add(fp)
+            logger.info(f"Loaded state: {len(self.state.completed_uris)} completed")
+        else:
+            logger.info("No existing state file found")
+        return loaded
 
     def save(self) -> None:
-        """Save current state to file."""
-        self.state.updated_at = datetime.now().isoformat()
-        
+        """Save pointer state to file; completed URIs live in the log.
+
+        The file is published atomically (temp file + fsync +
+        os.replace) so a crash mid-write cannot leave a torn state.json
+        that load() would silently discard on resume.
+        """
+        self.state.updated_at = _now_iso()
+
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        pointer = self.state.to_pointer_dict()
+
+        tmp = self.state_file.with_suffix(self.state_file.suffix + ".tmp")
         try:
-            with open(self.state_file, "w") as f:
-                json.dump(self.state.to_dict(), f, indent=2)
+            # Compact C-speed serialization; indent roughly doubled the
+            # bytes written for no benefit on a machine-read file
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(pointer))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_file)
             logger.debug(f"Saved state to {self.state_file}")
         except Exception as e:
+            tmp.unlink(missing_ok=True)
             logger.error(f"Failed to save state: {e}")
 
+        self._dirty_count = 0
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """Persist any buffered mutations immediately."""
+        if not self._completed_log.closed:
+            self._completed_log.flush()
+        if self._dirty_count:
+            self.save()
+
+    def close(self) -> None:
+        """Flush buffered state and close the completion log."""
+        self.flush()
+        if not self._completed_log.closed:
+            self._completed_log.close()
+
+    def _maybe_save(self) -> None:
+        """Save once enough mutations or time have accumulated."""
+        self._dirty_count += 1
+        if (self._dirty_count >= self.flush_every_n
+                or time.monotonic() - self._last_flush > self.flush_interval_secs):
+            self.save()
+
     def start_session(self, category: str, document_type: str) -> None:
         """Start or resume a download session.
         
@@ -105,21 +301,25 @@ class StateManager:
             document_type: Document type.
         """
         if self.state.started_at is None:
-            self.state.started_at = datetime.now().isoformat()
-        
-        self.state.current_category = category
-        self.state.current_document_type = document_type
+            self.state.started_at = _now_iso()
+
+        self.state.pages.setdefault(f"{category}/{document_type}", 1)
         self.save()
 
     def mark_completed(self, uri: str) -> None:
         """Mark a URI as completed.
-        
+
         Args:
             uri: Document URI that was successfully processed.
         """
-        self.state.completed_uris.add(uri)
+        fp = _fingerprint(uri)
+        # One write call so the record can't interleave with another
+        # writer's line
+        self._completed_log.write(fp.hex() + "\n")
+        self.state.completed_uris.add(fp)
+        self._bloom.add(fp)
         self.state.last_uri = uri
-        self.save()
+        self._maybe_save()
 
     def is_completed(self, uri: str) -> bool:
         """Check if a URI has been completed.
@@ -130,114 +330,253 @@ class StateManager:
         Returns:
             True if already completed.
         """
-        return uri in self.state.completed_uris
+        fp = _fingerprint(uri)
+        # Bloom miss means definitely not completed — the common case in
+        # a fresh listing — without touching the exact set
+        if fp not in self._bloom:
+            return False
+        return fp in self.state.completed_uris
+
+    def set_page(self, category: str, document_type: str, page: int) -> None:
+        """Update current page number for a document type.
 
-    def set_page(self, page: int) -> None:
-        """Update current page number.
-        
         Args:
+            category: Document category.
+            document_type: Document type.
             page: Current page being processed.
         """
-        self.state.current_page = page
-        self.save()
+        self.state.pages[f"{category}/{document_type}"] = page
+        self._maybe_save()
 
     def get_resume_page(self, category: str, document_type: str) -> int:
         """Get page to resume from.
-        
+
         Args:
             category: Document category.
             document_type: Document type.
-        
+
         Returns:
             Page number to resume from (1 if starting fresh).
         """
-        if (self.state.current_category == category and 
-            self.state.current_document_type == document_type):
-            return self.state.current_page
-        return 1
+        return self.state.pages.get(f"{category}/{document_type}", 1)
 
     def reset(self) -> None:
         """Reset state for a fresh start."""
+        self._completed_log.close()
         self.state = DownloadState()
-        if self.state_file.exists():
-            self.state_file.unlink()
+        self._bloom = _BloomFilter()
+        self.state_file.unlink(missing_ok=True)
+        self.completed_file.unlink(missing_ok=True)
+        self._completed_log = open(self.completed_file, "a", buffering=1 << 16)
         logger.info("State reset")
 
 
-@dataclass 
+@dataclass
 class ManifestEntry:
     """Single entry in the download manifest."""
 
     akn_uri: str
-    status: str  # success, skipped, error
+    status: str  # success, skipped, not-modified, error
     timestamp: str
     files: list[str] = field(default_factory=list)
     error: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _entry_dict(entry: ManifestEntry) -> dict:
+    """Serialize a ManifestEntry without dataclasses.asdict.
+
+    asdict walks fields via reflection and deep-copies values; a plain
+    dict literal is built once per entry and reused for both the jsonl
+    line and the aggregate dump.
+    """
+    return {
+        "akn_uri": entry.akn_uri,
+        "status": entry.status,
+        "timestamp": entry.timestamp,
+        "files": entry.files,
+        "error": entry.error,
+        "etag": entry.etag,
+        "last_modified": entry.last_modified,
+    }
 
 
 class ManifestManager:
-    """Manages download manifest for logging results."""
+    """Manages download manifest for logging results.
+
+    Entries are appended to ``manifest.jsonl`` one line each, so adding
+    an entry costs one short write instead of rewriting the whole
+    manifest. The aggregate ``manifest.json`` is a pure summary written
+    once by finalize() at session end; only counters and the latest
+    entry per URI (for conditional-GET validators) stay in memory, not
+    the full entry history.
+    """
 
     def __init__(self, manifest_file: Path):
         """Initialize manifest manager.
-        
+
         Args:
-            manifest_file: Path to manifest.json file.
+            manifest_file: Path to manifest.json file; the entry log
+                lives alongside it as manifest.jsonl.
         """
         self.manifest_file = manifest_file
-        self.entries: list[ManifestEntry] = []
+        self.jsonl_file = manifest_file.with_suffix(".jsonl")
+        # Latest raw entry dict per URI; ManifestEntry objects are only
+        # materialized on lookup
+        self._latest: dict[str, dict] = {}
+        # Running status counts; scanning entries on every save was O(N)
+        self._counts: dict[str, int] = {}
+        self._total = 0
         self._load()
 
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        self._jsonl = open(self.jsonl_file, "a", buffering=1 << 16)
+        atexit.register(self.close)
+
+    def _count(self, entry_dict: dict) -> None:
+        """Bump counters for one entry dict."""
+        status = entry_dict["status"]
+        self._counts[status] = self._counts.get(status, 0) + 1
+        self._total += 1
+
     def _load(self) -> None:
-        """Load existing manifest if present."""
-        if self.manifest_file.exists():
+        """Scan existing manifest entries for counters and validators.
+
+        Streams the jsonl line by line without building the full entry
+        list; a 200k-entry history costs one pass, not a resident list
+        of dataclasses.
+        """
+        if self.jsonl_file.exists():
             try:
-                with open(self.manifest_file) as f:
-                    data = json.load(f)
-                self.entries = [
-                    ManifestEntry(**entry) for entry in data.get("entries", [])
-                ]
-                logger.info(f"Loaded manifest with {len(self.entries)} entries")
+                with open(self.jsonl_file, "rb") as f:
+                    for line in f:
+                        if line.strip():
+                            d = orjson.loads(line)
+                            self._latest[d["akn_uri"]] = d
+                            self._count(d)
+                logger.info(f"Loaded manifest with {self._total} entries")
+            except Exception as e:
+                logger.warning(f"Failed to load manifest log: {e}")
+        elif self.manifest_file.exists():
+            # Legacy format: entries embedded in the aggregate json;
+            # parse once, keep only counters and latest-per-URI
+            try:
+                data = orjson.loads(self.manifest_file.read_bytes())
+                entries = data.get("entries", [])
+                for d in entries:
+                    self._latest[d["akn_uri"]] = d
+                    self._count(d)
+                # Migrate the history into the jsonl log now: finalize()
+                # rewrites the aggregate file as summary-only, which
+                # would otherwise destroy the entries on the first run
+                if entries:
+                    self._migrate_legacy_entries(entries)
+                logger.info(f"Loaded manifest with {self._total} entries")
             except Exception as e:
                 logger.warning(f"Failed to load manifest: {e}")
 
+    def _migrate_legacy_entries(self, entries: list[dict]) -> None:
+        """Write legacy embedded entries through to manifest.jsonl.
+
+        Published atomically (temp file + os.replace) so an interrupted
+        migration leaves no partial jsonl that a later load would
+        mistake for the full history.
+        """
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.jsonl_file.with_suffix(self.jsonl_file.suffix + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                for d in entries:
+                    f.write(orjson.dumps(d))
+                    f.write(b"\n")
+            os.replace(tmp, self.jsonl_file)
+            logger.info(f"Migrated {len(entries)} legacy manifest entries to {self.jsonl_file}")
+        except Exception as e:
+            tmp.unlink(missing_ok=True)
+            logger.error(f"Failed to migrate legacy manifest entries: {e}")
+
+    def _record(self, entry: ManifestEntry) -> None:
+        """Index one entry and append it to the jsonl log."""
+        d = _entry_dict(entry)
+        self._latest[entry.akn_uri] = d
+        self._count(d)
+        self._jsonl.write(orjson.dumps(d).decode())
+        self._jsonl.write("\n")
+
     def add(self, entry: ManifestEntry) -> None:
-        """Add an entry to the manifest.
-        
+        """Add an entry to the manifest log.
+
         Args:
             entry: Manifest entry to add.
         """
-        self.entries.append(entry)
+        self._record(entry)
+
+    def extend(self, entries: list[ManifestEntry]) -> None:
+        """Add a batch of entries to the manifest log.
+
+        Args:
+            entries: Manifest entries to add; call flush() to persist.
+        """
+        for entry in entries:
+            self._record(entry)
+
+    def flush(self) -> None:
+        """Flush buffered log lines to disk."""
+        if not self._jsonl.closed:
+            self._jsonl.flush()
+
+    def finalize(self) -> None:
+        """Write the aggregate manifest.json with summary counts."""
+        self.flush()
         self._save()
 
+    def close(self) -> None:
+        """Finalize the manifest and close the entry log."""
+        self.finalize()
+        if not self._jsonl.closed:
+            self._jsonl.close()
+
+    def latest_for(self, akn_uri: str) -> Optional[ManifestEntry]:
+        """Get the most recent entry for a URI, if any.
+
+        Args:
+            akn_uri: Document URI to look up.
+
+        Returns:
+            Latest ManifestEntry for the URI, or None.
+        """
+        d = self._latest.get(akn_uri)
+        if d is None:
+            return None
+        return ManifestEntry(**d)
+
     def _save(self) -> None:
-        """Save manifest to file."""
+        """Save the summary manifest; entries live in the jsonl log."""
         self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         data = {
-            "updated_at": datetime.now().isoformat(),
-            "total_entries": len(self.entries),
-            "success_count": sum(1 for e in self.entries if e.status == "success"),
-            "skipped_count": sum(1 for e in self.entries if e.status == "skipped"),
-            "error_count": sum(1 for e in self.entries if e.status == "error"),
-            "entries": [asdict(e) for e in self.entries],
+            "updated_at": _now_iso(),
+            "total_entries": self._total,
+            "success_count": self._counts.get("success", 0),
+            "skipped_count": self._counts.get("skipped", 0),
+            "error_count": self._counts.get("error", 0),
         }
-        
+
         try:
-            with open(self.manifest_file, "w") as f:
-                json.dump(data, f, indent=2)
+            self.manifest_file.write_bytes(orjson.dumps(data))
         except Exception as e:
             logger.error(f"Failed to save manifest: {e}")
 
     def summary(self) -> dict:
         """Get summary statistics.
-        
+
         Returns:
             Dict with counts by status.
         """
         return {
-            "total": len(self.entries),
-            "success": sum(1 for e in self.entries if e.status == "success"),
-            "skipped": sum(1 for e in self.entries if e.status == "skipped"),
-            "error": sum(1 for e in self.entries if e.status == "error"),
+            "total": self._total,
+            "success": self._counts.get("success", 0),
+            "skipped": self._counts.get("skipped", 0),
+            "error": self._counts.get("error", 0),
         }
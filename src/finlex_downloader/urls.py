@@ -1,15 +1,22 @@
 """URL parsing and path utilities for Finlex documents."""
 
-import re
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentInfo:
-    """Parsed document information from akn_uri."""
+    """Parsed document information from akn_uri.
+
+    Frozen and slotted: instances are created once per document, read
+    many times, and never mutated, so dropping the per-instance __dict__
+    keeps large listings compact and makes instances hashable for
+    caching.
+    """
 
     category: str  # act, judgment, doc
     document_type: str  # statute, statute-consolidated, etc.
@@ -18,109 +25,262 @@ class DocumentInfo:
     lang_and_version: str
     authority: Optional[str] = None  # For authority-regulation docs
 
+    # Shared path tail, computed once per instance: folder paths and the
+    # API path differ only by a /akn/fi/ prefix
+    _folder: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.authority:
+            tail = (
+                f"{self.category}/{self.document_type}/{self.authority}"
+                f"/{self.year}/{self.number}/{self.lang_and_version}"
+            )
+        else:
+            tail = (
+                f"{self.category}/{self.document_type}"
+                f"/{self.year}/{self.number}/{self.lang_and_version}"
+            )
+        object.__setattr__(self, "_folder", tail)
+
+    @property
+    def folder_str(self) -> str:
+        """Local folder path as a plain string.
+
+        For string-only consumers (logging, manifest entries) this skips
+        Path construction entirely.
+        """
+        return self._folder
+
     @property
     def folder_path(self) -> Path:
         """Generate local folder path for this document."""
-        if self.authority:
-            return Path(
-                self.category,
-                self.document_type,
-                self.authority,
-                self.year,
-                self.number,
-                self.lang_and_version,
-            )
-        return Path(
-            self.category,
-            self.document_type,
-            self.year,
-            self.number,
-            self.lang_and_version,
-        )
-
-
-# Pattern for standard documents: /akn/fi/{category}/{type}/{year}/{number}/{langAndVersion}
-STANDARD_PATTERN = re.compile(
-    r"/akn/fi/(?P<category>act|judgment|doc)/(?P<type>[^/]+)/(?P<year>\d+)/(?P<number>[^/]+)/(?P<lang>[^/]+)$"
-)
+        return _folder_path(self)
+
 
-# Pattern for authority-regulation: /akn/fi/doc/authority-regulation/{authority}/{year}/{number}/{langAndVersion}
-AUTHORITY_PATTERN = re.compile(
-    r"/akn/fi/doc/authority-regulation/(?P<authority>[^/]+)/(?P<year>\d+)/(?P<number>[^/]+)/(?P<lang>[^/]+)$"
+@functools.lru_cache(maxsize=65536)
+def _folder_path(info: DocumentInfo) -> Path:
+    """Wrap the precomputed folder string in a Path at the I/O boundary.
+
+    Memoized: the downloader reads folder_path several times per
+    document (XML, PDF, media destinations), and Path construction
+    allocates and normalizes parts on every call.
+    """
+    return Path(info._folder)
+
+
+# URI shapes handled by the parser, relative to this anchor:
+#   /akn/fi/doc/authority-regulation/{authority}/{year}/{number}/{langAndVersion}
+#   /akn/fi/{category}/{type}/{year}/{number}/{langAndVersion}
+_PREFIX = "/akn/fi/"
+
+# Known (category, document type) pairs served by the list endpoints
+_KNOWN_LIST_PAIRS = (
+    ("act", "statute"),
+    ("act", "statute-consolidated"),
+    ("act", "statute-translated"),
+    ("act", "statute-aland"),
+    ("act", "statute-sami"),
+    ("judgment", "kko"),
+    ("judgment", "kho"),
+    ("doc", "government-proposal"),
+    ("doc", "treaty"),
+    ("doc", "treaty-consolidated"),
+    ("doc", "authority-regulation"),
 )
 
+# Known tokens mapped to interned singletons: thousands of DocumentInfo
+# instances then share one str object per category/type, shrinking
+# resident memory and reducing equality checks to pointer compares
+_CATEGORIES = {s: sys.intern(s) for s in ("act", "judgment", "doc")}
+_DOCTYPES = {d: sys.intern(d) for _, d in _KNOWN_LIST_PAIRS}
+
+# Document types whose URIs carry an extra authority segment
+_AUTHORITY_DOCTYPES = frozenset({"authority-regulation"})
+
+
+def _decode_lang(s: str) -> str:
+    """Decode percent escapes in a language/version token.
+
+    Specialized for the escapes AKN lang tokens actually carry (%40 for
+    the @ version marker, %2B for +); anything rarer falls back to the
+    general unquote state machine. The common unescaped case returns
+    the input untouched.
+    """
+    if "%" not in s:
+        return s
+    s = s.replace("%40", "@").replace("%2B", "+")
+    if "%" in s:
+        s = unquote(s)
+    return s
+
+# Every valid list path baked at import over the finite pair space, so
+# build_list_path is a dict hit with no string building at all
+_LIST_PATHS = {(c, d): f"/akn/fi/{c}/{d}/list" for c, d in _KNOWN_LIST_PAIRS}
+
+
+def _parse_akn_tokens(uri: str) -> Optional[tuple]:
+    """Parse an akn URI into its raw component tokens.
+
+    Pure string ops: one find for the /akn/fi/ anchor (which also strips
+    any full-URL prefix), one split, then membership/digit checks per
+    segment. Only the language segment is unquoted, and only when it
+    actually carries a percent escape (e.g. fin%40 for fin@).
+
+    Call sites that only route on category/type can use the tuple
+    directly without paying for a DocumentInfo allocation.
+
+    Args:
+        uri: Full URL or bare /akn/fi/... path.
+
+    Returns:
+        (category, document_type, authority, year, number,
+        lang_and_version) with authority None for standard documents,
+        or None if the URI does not parse.
+    """
+    # Dispatch on the first character: rooted paths ('/') usually start
+    # at the anchor outright and skip the substring search; URLs ('h')
+    # and base-prefixed paths use the general find. Anything else
+    # cannot contain an akn path.
+    head = uri[:1]
+    if head == "/" and uri.startswith(_PREFIX):
+        rest = uri[len(_PREFIX):]
+    elif head == "h" or head == "/":
+        idx = uri.find(_PREFIX)
+        if idx < 0:
+            return None
+        rest = uri[idx + len(_PREFIX):]
+    else:
+        return None
+    parts = rest.split("/")
+
+    # Segment count decides the shape: 6 means an authority-qualified
+    # URI, 5 a plain one — a single integer compare before the
+    # per-segment validation
+    n = len(parts)
+    if n == 6:
+        category, doc_type, authority, year, number, lang = parts
+        if category != "doc" or doc_type not in _AUTHORITY_DOCTYPES or not authority:
+            return None
+    elif n == 5:
+        category, doc_type, year, number, lang = parts
+        authority = None
+        if category not in _CATEGORIES:
+            return None
+    else:
+        return None
+
+    if not (doc_type and year.isdigit() and number and lang):
+        return None
+    lang = _decode_lang(lang)
+
+    return (
+        _CATEGORIES.get(category, category),
+        _DOCTYPES.get(doc_type, doc_type),
+        authority,
+        year,
+        number,
+        lang,
+    )
 
+
+@functools.lru_cache(maxsize=65536)
+def _interned(info: DocumentInfo) -> DocumentInfo:
+    """Return the canonical instance for an equal DocumentInfo.
+
+    The same document surfaces under several URI spellings (full URL,
+    bare path), each producing an equal-but-distinct object; the intern
+    table collapses them to one shared instance so dedup sets and `is`
+    comparisons work and duplicates become garbage immediately. A
+    bounded lru_cache stands in for a WeakValueDictionary because the
+    slotted dataclass has no __weakref__ on the oldest supported
+    Python.
+    """
+    return info
+
+
+@functools.lru_cache(maxsize=65536)
 def parse_akn_uri(uri: str) -> Optional[DocumentInfo]:
     """Parse an akn_uri to extract document components.
-    
+
+    Thin wrapper over _parse_akn_tokens that materializes a
+    DocumentInfo. Results are memoized since the same URIs recur across
+    resume restarts and multiple call sites per document, and equal
+    results from different URI spellings share one interned instance.
+
     Args:
         uri: Full URL or path like:
             https://opendata.finlex.fi/finlex/avoindata/v1/akn/fi/act/statute/2024/123/fin@
             /akn/fi/act/statute/2024/123/fin@
-    
+
     Returns:
         DocumentInfo with parsed components, or None if parsing fails.
     """
-    # Extract path from full URL if needed
-    if uri.startswith("http"):
-        parsed = urlparse(uri)
-        path = unquote(parsed.path)
-        # Remove base path prefix
-        if "/finlex/avoindata/v1" in path:
-            path = path.split("/finlex/avoindata/v1")[-1]
-    else:
-        path = unquote(uri)
-
-    # Try authority-regulation pattern first (more specific)
-    match = AUTHORITY_PATTERN.match(path)
-    if match:
-        return DocumentInfo(
-            category="doc",
-            document_type="authority-regulation",
-            authority=match.group("authority"),
-            year=match.group("year"),
-            number=match.group("number"),
-            lang_and_version=match.group("lang"),
-        )
-
-    # Try standard pattern
-    match = STANDARD_PATTERN.match(path)
-    if match:
-        return DocumentInfo(
-            category=match.group("category"),
-            document_type=match.group("type"),
-            year=match.group("year"),
-            number=match.group("number"),
-            lang_and_version=match.group("lang"),
-        )
-
-    return None
+    tokens = _parse_akn_tokens(uri)
+    if tokens is None:
+        return None
+    category, document_type, authority, year, number, lang = tokens
+    return _interned(DocumentInfo(
+        category=category,
+        document_type=document_type,
+        year=year,
+        number=number,
+        lang_and_version=lang,
+        authority=authority,
+    ))
+
+
+def parse_akn_uris(uris) -> list[Optional[DocumentInfo]]:
+    """Parse a batch of akn URIs in one pass.
+
+    For list responses with hundreds of URIs this amortizes the global
+    lookups of the per-item path: the parser and list append are bound
+    to locals outside the loop, and each parse still goes through the
+    shared memoization cache.
+
+    Args:
+        uris: Iterable of akn URIs.
+
+    Returns:
+        DocumentInfo (or None for unparseable URIs) per input, in order.
+    """
+    parse = parse_akn_uri
+    out: list[Optional[DocumentInfo]] = []
+    append = out.append
+    for uri in uris:
+        append(parse(uri))
+    return out
 
 
 def build_api_path(info: DocumentInfo) -> str:
     """Build API path from DocumentInfo.
-    
+
+    One concatenation onto the tail precomputed at construction; the
+    same path is requested for each artifact (XML, PDF, ZIP, media) of
+    a document.
+
     Args:
         info: Parsed document information.
-    
+
     Returns:
         API path string.
     """
-    if info.authority:
-        return f"/akn/fi/{info.category}/{info.document_type}/{info.authority}/{info.year}/{info.number}/{info.lang_and_version}"
-    return f"/akn/fi/{info.category}/{info.document_type}/{info.year}/{info.number}/{info.lang_and_version}"
+    return _PREFIX + info._folder
 
 
 def build_list_path(category: str, document_type: str) -> str:
     """Build list endpoint path.
-    
+
+    Known pairs resolve through the pre-baked table; anything else is
+    formatted on the fly.
+
     Args:
         category: act, judgment, or doc.
         document_type: Specific document type.
-    
+
     Returns:
         List endpoint path.
     """
-    if document_type == "authority-regulation":
-        return f"/akn/fi/{category}/{document_type}/list"
-    return f"/akn/fi/{category}/{document_type}/list"
+    path = _LIST_PATHS.get((category, document_type))
+    if path is None:
+        path = f"/akn/fi/{category}/{document_type}/list"
+    return path
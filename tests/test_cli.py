@@ -1,9 +1,11 @@
 """Tests for CLI."""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 
-from finlex_downloader.cli import parse_args, get_years_for_type
+from finlex_downloader.cli import parse_args, get_years_for_type, download_batch
 
 
 class TestParseArgs:
@@ -72,6 +74,28 @@ class TestParseArgs:
         assert args.sleep == 10.0
 
 
+class TestDownloadBatch:
+    """Tests for the concurrent batch driver."""
+
+    def test_results_preserve_input_order(self, monkeypatch):
+        """Results come back in input order however downloads finish."""
+        import finlex_downloader.downloader_async as downloader_async
+        from finlex_downloader.downloader import DownloadResult
+
+        async def fake_download(client, uri, options, prior=None):
+            # Later URIs finish first to prove ordering isn't by completion
+            await asyncio.sleep(0.01 if uri.endswith("1") else 0)
+            return DownloadResult(akn_uri=uri, status="success", timestamp="t")
+
+        monkeypatch.setattr(downloader_async, "download_document_async", fake_download)
+        args = parse_args(["--concurrency", "3", "--sleep", "0"])
+        uris = ["u1", "u2", "u3"]
+
+        results = download_batch(uris, args, options=None)
+
+        assert [r.akn_uri for r in results] == uris
+
+
 class TestGetYearsForType:
     """Tests for get_years_for_type function."""
 
@@ -1,10 +1,38 @@
 """Tests for HTTP client."""
 
+import time
+
 import pytest
 import responses
 from responses import matchers
 
-from finlex_downloader.client import FinlexClient
+from finlex_downloader.client import FinlexClient, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiter."""
+
+    def test_burst_within_capacity(self):
+        """Bucket allows a full burst without blocking."""
+        bucket = TokenBucket(rate=3, interval=60)
+
+        start = time.monotonic()
+        for _ in range(3):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+
+    def test_blocks_when_empty(self):
+        """Bucket blocks until a token refills."""
+        bucket = TokenBucket(rate=1, interval=0.2)
+        bucket.acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.1
 
 
 class TestFinlexClient:
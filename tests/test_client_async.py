@@ -0,0 +1,135 @@
+"""Tests for the async HTTP client."""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from finlex_downloader.client_async import AsyncFinlexClient
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response context manager."""
+
+    def __init__(self, status=200, body=b"", headers=None):
+        self.status = status
+        self._body = body
+        self.headers = headers or {}
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class FailingRequest:
+    """Request context that raises on entry, like a failed connect."""
+
+    def __init__(self, error):
+        self._error = error
+
+    async def __aenter__(self):
+        raise self._error
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class FakeSession:
+    """Replays a scripted sequence of responses/errors for get()."""
+
+    closed = False
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = []
+
+    def get(self, url, params=None, headers=None):
+        self.calls.append({"url": url, "params": params, "headers": headers})
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            return FailingRequest(outcome)
+        return outcome
+
+
+def make_client(outcomes, **kwargs):
+    """Build a client with no pacing and a scripted fake session."""
+    kwargs.setdefault("sleep_seconds", 0)
+    kwargs.setdefault("backoff_factor", 0)
+    client = AsyncFinlexClient(**kwargs)
+    client._session = FakeSession(outcomes)
+    return client
+
+
+class TestAsyncFinlexClient:
+    """Tests for AsyncFinlexClient retry behavior."""
+
+    def test_success_returns_status_body_headers(self):
+        """A 200 returns the body and response headers."""
+        client = make_client([FakeResponse(200, b"data", {"ETag": '"v1"'})])
+
+        status, body, headers = asyncio.run(client.get("/test"))
+
+        assert (status, body) == (200, b"data")
+        assert headers["ETag"] == '"v1"'
+
+    def test_retries_5xx_then_succeeds(self):
+        """A retryable status is retried until a good response arrives."""
+        client = make_client(
+            [FakeResponse(503), FakeResponse(200, b"ok")],
+            max_retries=2,
+        )
+
+        status, body, _ = asyncio.run(client.get("/test"))
+
+        assert (status, body) == (200, b"ok")
+        assert len(client._session.calls) == 2
+
+    def test_raises_after_network_errors(self):
+        """Persistent network errors raise once retries are exhausted."""
+        client = make_client(
+            [aiohttp.ClientError("boom"), aiohttp.ClientError("boom")],
+            max_retries=1,
+        )
+
+        with pytest.raises(aiohttp.ClientError):
+            asyncio.run(client.get("/test"))
+
+    def test_returns_final_status_after_mixed_failures(self):
+        """A response on a later attempt clears an earlier network error."""
+        client = make_client(
+            [aiohttp.ClientError("boom"), FakeResponse(503, b"unavailable")],
+            max_retries=1,
+        )
+
+        status, body, _ = asyncio.run(client.get("/test"))
+
+        assert status == 503
+
+    def test_http_date_retry_after_falls_back_to_backoff(self):
+        """An HTTP-date Retry-After doesn't abort the retry loop."""
+        client = make_client(
+            [
+                FakeResponse(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}),
+                FakeResponse(200, b"ok"),
+            ],
+            max_retries=1,
+        )
+
+        status, body, _ = asyncio.run(client.get("/test"))
+
+        assert (status, body) == (200, b"ok")
+
+    def test_extra_headers_are_sent(self):
+        """Conditional-GET validators reach the request headers."""
+        client = make_client([FakeResponse(304)])
+
+        asyncio.run(client.get_xml("/test", extra_headers={"If-None-Match": '"v1"'}))
+
+        sent = client._session.calls[0]["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["Accept"] == "application/xml"
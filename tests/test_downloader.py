@@ -1,9 +1,21 @@
 """Tests for document downloader."""
 
 import pytest
+import responses
 from pathlib import Path
 
-from finlex_downloader.downloader import extract_media_links, DownloadOptions
+from finlex_downloader.client import FinlexClient
+from finlex_downloader.downloader import (
+    DownloadOptions,
+    atomic_write_bytes,
+    download_document,
+    extract_media_links,
+    stream_to_file,
+)
+from finlex_downloader.state import ManifestEntry
+
+BASE = "https://opendata.finlex.fi/finlex/avoindata/v1"
+URI = "/akn/fi/act/statute/2024/123/fin@"
 
 
 class TestExtractMediaLinks:
@@ -100,6 +112,133 @@ class TestExtractMediaLinks:
         assert links == []
 
 
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_writes_and_cleans_up(self, tmp_path):
+        """Data lands at the destination with no temp file left over."""
+        dest = tmp_path / "main.xml"
+
+        atomic_write_bytes(dest, b"<xml/>")
+
+        assert dest.read_bytes() == b"<xml/>"
+        assert not (tmp_path / "main.xml.tmp").exists()
+
+
+class TestStreamToFile:
+    """Tests for stream_to_file."""
+
+    @responses.activate
+    def test_streams_body_on_200(self, tmp_path):
+        """A 200 body is written to the destination."""
+        responses.add(responses.GET, f"{BASE}{URI}/main.pdf", body=b"%PDF", status=200)
+        client = FinlexClient(sleep_seconds=0)
+        dest = tmp_path / "main.pdf"
+
+        status = stream_to_file(client, f"{URI}/main.pdf", "application/pdf", dest)
+
+        assert status == 200
+        assert dest.read_bytes() == b"%PDF"
+
+    @responses.activate
+    def test_no_file_on_404(self, tmp_path):
+        """A 404 leaves nothing on disk."""
+        responses.add(responses.GET, f"{BASE}{URI}/main.pdf", status=404)
+        client = FinlexClient(sleep_seconds=0)
+        dest = tmp_path / "main.pdf"
+
+        status = stream_to_file(client, f"{URI}/main.pdf", "application/pdf", dest)
+
+        assert status == 404
+        assert not dest.exists()
+
+
+class TestDownloadDocument:
+    """Tests for download_document resume and revalidation."""
+
+    @responses.activate
+    def test_downloads_xml(self, tmp_path):
+        """A fresh document fetches XML and captures validators."""
+        responses.add(
+            responses.GET, f"{BASE}{URI}", body=b"<xml/>", status=200,
+            headers={"ETag": '"v1"'},
+        )
+        client = FinlexClient(sleep_seconds=0)
+        options = DownloadOptions(output_dir=tmp_path)
+
+        result = download_document(client, URI, options)
+
+        assert result.status == "success"
+        assert result.etag == '"v1"'
+        assert (tmp_path / "act/statute/2024/123/fin@/main.xml").read_bytes() == b"<xml/>"
+
+    def test_skips_complete_document(self, tmp_path):
+        """Nothing is fetched when every requested artifact exists."""
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = FinlexClient(sleep_seconds=0)
+        options = DownloadOptions(output_dir=tmp_path)
+
+        # No responses registered: any request would error
+        result = download_document(client, URI, options)
+
+        assert result.status == "skipped"
+
+    @responses.activate
+    def test_backfills_missing_pdf(self, tmp_path):
+        """A resumed run with --pdf fetches only the missing artifact."""
+        responses.add(responses.GET, f"{BASE}{URI}/main.pdf", body=b"%PDF", status=200)
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = FinlexClient(sleep_seconds=0)
+        options = DownloadOptions(output_dir=tmp_path, fetch_pdf=True)
+
+        result = download_document(client, URI, options)
+
+        assert result.status == "success"
+        assert (doc_dir / "main.pdf").read_bytes() == b"%PDF"
+        # Only the PDF endpoint was hit; the local XML copy was reused
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_not_modified_with_prior(self, tmp_path):
+        """A 304 against prior validators reuses the manifest entry."""
+        responses.add(responses.GET, f"{BASE}{URI}", status=304)
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = FinlexClient(sleep_seconds=0)
+        options = DownloadOptions(output_dir=tmp_path, force=True)
+        prior = ManifestEntry(
+            akn_uri=URI,
+            status="success",
+            timestamp="t",
+            files=[str(doc_dir / "main.xml")],
+            etag='"v1"',
+        )
+
+        result = download_document(client, URI, options, prior=prior)
+
+        assert result.status == "not-modified"
+        assert result.etag == '"v1"'
+        assert responses.calls[0].request.headers["If-None-Match"] == '"v1"'
+
+    @responses.activate
+    def test_304_without_validators_is_error(self, tmp_path):
+        """An unprompted 304 must not mark the document completed."""
+        responses.add(responses.GET, f"{BASE}{URI}", status=304)
+        client = FinlexClient(sleep_seconds=0)
+        options = DownloadOptions(output_dir=tmp_path)
+
+        result = download_document(client, URI, options)
+
+        assert result.status == "error"
+        assert "304" in result.error
+        assert result.files == []
+
+
 class TestDownloadOptions:
     """Tests for DownloadOptions dataclass."""
 
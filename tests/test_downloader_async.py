@@ -0,0 +1,111 @@
+"""Tests for the async document downloader."""
+
+import asyncio
+
+import pytest
+
+from finlex_downloader.downloader import DownloadOptions
+from finlex_downloader.downloader_async import download_document_async
+from finlex_downloader.state import ManifestEntry
+
+URI = "/akn/fi/act/statute/2024/123/fin@"
+
+
+class StubAsyncClient:
+    """Canned per-artifact responses; records conditional-GET headers."""
+
+    def __init__(self, xml=(200, b"<xml/>", {}), pdf=(404, b"", {}), zip_=(404, b"", {})):
+        self._xml = xml
+        self._pdf = pdf
+        self._zip = zip_
+        self.xml_requests = []
+
+    async def get_xml(self, path, params=None, extra_headers=None):
+        self.xml_requests.append(extra_headers)
+        return self._xml
+
+    async def get_pdf(self, path, params=None):
+        return self._pdf
+
+    async def get_zip(self, path, params=None):
+        return self._zip
+
+    async def get(self, path, params=None, accept="application/xml"):
+        return (404, b"", {})
+
+
+class TestDownloadDocumentAsync:
+    """Tests for download_document_async."""
+
+    def test_downloads_xml(self, tmp_path):
+        """A fresh document fetches XML and captures validators."""
+        client = StubAsyncClient(xml=(200, b"<xml/>", {"ETag": '"v1"'}))
+        options = DownloadOptions(output_dir=tmp_path)
+
+        result = asyncio.run(download_document_async(client, URI, options))
+
+        assert result.status == "success"
+        assert result.etag == '"v1"'
+        xml_path = tmp_path / "act/statute/2024/123/fin@/main.xml"
+        assert xml_path.read_bytes() == b"<xml/>"
+        assert str(xml_path) in result.files
+
+    def test_skips_complete_document(self, tmp_path):
+        """Nothing is fetched when every requested artifact exists."""
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = StubAsyncClient()
+        options = DownloadOptions(output_dir=tmp_path)
+
+        result = asyncio.run(download_document_async(client, URI, options))
+
+        assert result.status == "skipped"
+        assert client.xml_requests == []
+
+    def test_backfills_missing_pdf(self, tmp_path):
+        """A resumed run with --pdf fetches only the missing artifact."""
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = StubAsyncClient(pdf=(200, b"%PDF", {}))
+        options = DownloadOptions(output_dir=tmp_path, fetch_pdf=True)
+
+        result = asyncio.run(download_document_async(client, URI, options))
+
+        assert result.status == "success"
+        assert (doc_dir / "main.pdf").read_bytes() == b"%PDF"
+        assert client.xml_requests == []  # local XML copy reused
+
+    def test_not_modified_with_prior(self, tmp_path):
+        """A 304 against prior validators reuses the manifest entry."""
+        doc_dir = tmp_path / "act/statute/2024/123/fin@"
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "main.xml").write_bytes(b"<xml/>")
+        client = StubAsyncClient(xml=(304, b"", {}))
+        options = DownloadOptions(output_dir=tmp_path, force=True)
+        prior = ManifestEntry(
+            akn_uri=URI,
+            status="success",
+            timestamp="t",
+            files=[str(doc_dir / "main.xml")],
+            etag='"v1"',
+        )
+
+        result = asyncio.run(download_document_async(client, URI, options, prior=prior))
+
+        assert result.status == "not-modified"
+        assert result.etag == '"v1"'
+        assert result.files == prior.files
+        assert client.xml_requests == [{"If-None-Match": '"v1"'}]
+
+    def test_304_without_validators_is_error(self, tmp_path):
+        """An unprompted 304 must not mark the document completed."""
+        client = StubAsyncClient(xml=(304, b"", {}))
+        options = DownloadOptions(output_dir=tmp_path)
+
+        result = asyncio.run(download_document_async(client, URI, options))
+
+        assert result.status == "error"
+        assert "304" in result.error
+        assert result.files == []
@@ -9,6 +9,7 @@ from finlex_downloader.state import (
     StateManager,
     ManifestEntry,
     ManifestManager,
+    _fingerprint,
 )
 
 
@@ -18,29 +19,39 @@ class TestDownloadState:
     def test_to_dict(self):
         """Convert state to dict."""
         state = DownloadState(
-            current_category="act",
-            current_document_type="statute",
-            current_page=5,
-            completed_uris={"uri1", "uri2"},
+            pages={"act/statute": 5},
+            completed_uris={_fingerprint("uri1"), _fingerprint("uri2")},
         )
         d = state.to_dict()
-        
-        assert d["current_category"] == "act"
-        assert d["current_page"] == 5
-        assert set(d["completed_uris"]) == {"uri1", "uri2"}
+
+        assert d["pages"] == {"act/statute": 5}
+        assert set(d["completed_uris"]) == {
+            _fingerprint("uri1").hex(),
+            _fingerprint("uri2").hex(),
+        }
 
     def test_from_dict(self):
         """Create state from dict."""
+        data = {
+            "pages": {"judgment/kko": 3},
+            # Legacy state stored raw URIs; they decode to fingerprints
+            "completed_uris": ["uri1"],
+        }
+        state = DownloadState.from_dict(data)
+
+        assert state.pages == {"judgment/kko": 3}
+        assert _fingerprint("uri1") in state.completed_uris
+
+    def test_from_dict_legacy_pointer(self):
+        """Legacy single-pointer state folds into the pages map."""
         data = {
             "current_category": "judgment",
+            "current_document_type": "kko",
             "current_page": 3,
-            "completed_uris": ["uri1"],
         }
         state = DownloadState.from_dict(data)
-        
-        assert state.current_category == "judgment"
-        assert state.current_page == 3
-        assert "uri1" in state.completed_uris
+
+        assert state.pages == {"judgment/kko": 3}
 
 
 class TestStateManager:
@@ -49,22 +60,21 @@ class TestStateManager:
     def test_save_and_load(self, tmp_path):
         """State saves and loads correctly."""
         state_file = tmp_path / "state.json"
-        
+
         # Save state
         manager1 = StateManager(state_file)
-        manager1.state.current_category = "act"
-        manager1.state.current_page = 10
-        manager1.state.completed_uris.add("test-uri")
+        manager1.set_page("act", "statute", 10)
+        manager1.mark_completed("test-uri")
         manager1.save()
-        
+        manager1.close()
+
         # Load in new manager
         manager2 = StateManager(state_file)
         loaded = manager2.load()
-        
+
         assert loaded is True
-        assert manager2.state.current_category == "act"
-        assert manager2.state.current_page == 10
-        assert "test-uri" in manager2.state.completed_uris
+        assert manager2.get_resume_page("act", "statute") == 10
+        assert manager2.is_completed("test-uri")
 
     def test_load_nonexistent(self, tmp_path):
         """Load returns False when no state file."""
@@ -72,52 +82,104 @@ class TestStateManager:
         assert manager.load() is False
 
     def test_mark_completed(self, tmp_path):
-        """mark_completed adds URI and saves."""
+        """mark_completed adds URI to the completed set."""
         state_file = tmp_path / "state.json"
         manager = StateManager(state_file)
-        
+
         manager.mark_completed("uri1")
         manager.mark_completed("uri2")
-        
+
         assert manager.is_completed("uri1")
         assert manager.is_completed("uri2")
         assert not manager.is_completed("uri3")
 
+    def test_save_is_debounced(self, tmp_path):
+        """Mutations are buffered until the flush threshold is reached."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(state_file, flush_every_n=3, flush_interval_secs=3600)
+
+        manager.mark_completed("uri1")
+        manager.mark_completed("uri2")
+        assert not state_file.exists()
+
+        manager.mark_completed("uri3")
+        assert state_file.exists()
+
+    def test_completed_log_is_append_only(self, tmp_path):
+        """Completions are appended to completed.log one per line."""
+        manager = StateManager(tmp_path / "state.json")
+
+        manager.mark_completed("uri1")
+        manager.mark_completed("uri2")
+        manager.close()
+
+        lines = (tmp_path / "completed.log").read_text().splitlines()
+        assert lines == [_fingerprint("uri1").hex(), _fingerprint("uri2").hex()]
+
+    def test_legacy_completed_jsonl_migrates(self, tmp_path):
+        """A pre-rename completed.jsonl folds into completed.log on load."""
+        (tmp_path / "completed.jsonl").write_text(_fingerprint("uri1").hex() + "\n")
+
+        manager = StateManager(tmp_path / "state.json")
+        assert manager.load() is True
+
+        assert manager.is_completed("uri1")
+        assert not (tmp_path / "completed.jsonl").exists()
+        assert _fingerprint("uri1").hex() in (tmp_path / "completed.log").read_text()
+
+    def test_flush_forces_save(self, tmp_path):
+        """flush persists buffered mutations immediately."""
+        state_file = tmp_path / "state.json"
+        manager = StateManager(state_file, flush_every_n=100, flush_interval_secs=3600)
+
+        manager.mark_completed("uri1")
+        assert not state_file.exists()
+
+        manager.flush()
+        assert state_file.exists()
+
     def test_get_resume_page(self, tmp_path):
         """get_resume_page returns correct page."""
         state_file = tmp_path / "state.json"
         manager = StateManager(state_file)
-        manager.state.current_category = "act"
-        manager.state.current_document_type = "statute"
-        manager.state.current_page = 5
-        
+        manager.set_page("act", "statute", 5)
+
         # Same category/type returns saved page
         assert manager.get_resume_page("act", "statute") == 5
-        
+
         # Different category/type returns 1
         assert manager.get_resume_page("judgment", "kko") == 1
 
+    def test_pages_are_tracked_per_type(self, tmp_path):
+        """Each doc type keeps its own resume page."""
+        manager = StateManager(tmp_path / "state.json")
+        manager.set_page("act", "statute", 7)
+        manager.set_page("judgment", "kko", 2)
+
+        assert manager.get_resume_page("act", "statute") == 7
+        assert manager.get_resume_page("judgment", "kko") == 2
+
     def test_reset(self, tmp_path):
         """reset clears state and removes file."""
         state_file = tmp_path / "state.json"
         manager = StateManager(state_file)
-        manager.state.current_page = 10
+        manager.set_page("act", "statute", 10)
         manager.save()
-        
+
         manager.reset()
-        
-        assert manager.state.current_page == 1
+
+        assert manager.get_resume_page("act", "statute") == 1
         assert not state_file.exists()
 
 
 class TestManifestManager:
     """Tests for ManifestManager."""
 
-    def test_add_and_save(self, tmp_path):
-        """Manifest entries are saved."""
+    def test_add_and_finalize(self, tmp_path):
+        """Entries go to the jsonl log; finalize writes the summary."""
         manifest_file = tmp_path / "manifest.json"
         manager = ManifestManager(manifest_file)
-        
+
         entry = ManifestEntry(
             akn_uri="test-uri",
             status="success",
@@ -125,8 +187,14 @@ class TestManifestManager:
             files=["file1.xml"],
         )
         manager.add(entry)
-        
-        # Verify file written
+        manager.finalize()
+
+        # One line per entry in the append-only log
+        lines = (tmp_path / "manifest.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["akn_uri"] == "test-uri"
+
+        # Aggregate summary written by finalize
         assert manifest_file.exists()
         with open(manifest_file) as f:
             data = json.load(f)
@@ -148,3 +216,49 @@ class TestManifestManager:
         assert summary["success"] == 2
         assert summary["skipped"] == 1
         assert summary["error"] == 1
+
+    def test_latest_for(self, tmp_path):
+        """latest_for returns the most recent entry for a URI."""
+        manifest_file = tmp_path / "manifest.json"
+        manager = ManifestManager(manifest_file)
+
+        manager.add(ManifestEntry(akn_uri="u1", status="success", timestamp="t1", etag='"v1"'))
+        manager.add(ManifestEntry(akn_uri="u1", status="success", timestamp="t2", etag='"v2"'))
+
+        assert manager.latest_for("u1").etag == '"v2"'
+        assert manager.latest_for("unknown") is None
+
+    def test_legacy_manifest_migrates_to_jsonl(self, tmp_path):
+        """Entries embedded in an old manifest.json move to the jsonl log."""
+        manifest_file = tmp_path / "manifest.json"
+        manifest_file.write_text(json.dumps({
+            "entries": [{
+                "akn_uri": "u1",
+                "status": "success",
+                "timestamp": "t",
+                "files": [],
+                "error": None,
+                "etag": '"v1"',
+                "last_modified": None,
+            }],
+        }))
+
+        manager = ManifestManager(manifest_file)
+        manager.close()  # finalize rewrites manifest.json as summary-only
+
+        # The history survives in the jsonl log and a fresh load sees it
+        lines = (tmp_path / "manifest.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        reloaded = ManifestManager(manifest_file)
+        assert reloaded.latest_for("u1").etag == '"v1"'
+        assert reloaded.summary()["success"] == 1
+
+    def test_latest_for_survives_reload(self, tmp_path):
+        """Entry lookup works after loading an existing manifest."""
+        manifest_file = tmp_path / "manifest.json"
+        manager = ManifestManager(manifest_file)
+        manager.add(ManifestEntry(akn_uri="u1", status="success", timestamp="t", etag='"v1"'))
+        manager.flush()
+
+        reloaded = ManifestManager(manifest_file)
+        assert reloaded.latest_for("u1").etag == '"v1"'
@@ -6,6 +6,7 @@ from pathlib import Path
 from finlex_downloader.urls import (
     DocumentInfo,
     parse_akn_uri,
+    parse_akn_uris,
     build_api_path,
     build_list_path,
 )
@@ -83,6 +84,24 @@ class TestParseAknUri:
         assert parse_akn_uri("") is None
 
 
+class TestParseAknUris:
+    """Tests for the batch parse_akn_uris function."""
+
+    def test_batch_preserves_order_and_failures(self):
+        """Batch parse returns one result per input, None for invalid."""
+        uris = [
+            "/akn/fi/act/statute/2024/123/fin@",
+            "/invalid/path",
+            "/akn/fi/judgment/kko/2023/45/fin@",
+        ]
+        results = parse_akn_uris(uris)
+
+        assert len(results) == 3
+        assert results[0] == parse_akn_uri(uris[0])
+        assert results[1] is None
+        assert results[2].category == "judgment"
+
+
 class TestDocumentInfoFolderPath:
     """Tests for DocumentInfo.folder_path property."""
 
@@ -111,6 +130,18 @@ class TestDocumentInfoFolderPath:
         expected = Path("doc/authority-regulation/metsahallitus/1996/32082/fin@")
         assert info.folder_path == expected
 
+    def test_folder_str(self):
+        """folder_str matches folder_path without Path construction."""
+        info = DocumentInfo(
+            category="act",
+            document_type="statute",
+            year="2024",
+            number="123",
+            lang_and_version="fin@",
+        )
+        assert info.folder_str == "act/statute/2024/123/fin@"
+        assert Path(info.folder_str) == info.folder_path
+
 
 class TestBuildApiPath:
     """Tests for build_api_path function."""